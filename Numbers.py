@@ -1,3 +1,6 @@
+from ametrine.calc.primes import is_prime
+from ametrine.calc import combinatorics
+
 def factorial(n: int) -> int:
     """
     Calculates the factorial of a number
@@ -8,10 +11,7 @@ def factorial(n: int) -> int:
     #### Returns:
         int: The factorial of n
     """
-    out: int = 1
-    for i in range(1, n + 1):
-        out *= i
-    return out
+    return combinatorics.factorial(n)
 
 def isPrime(n: int) -> bool:
     """
@@ -23,9 +23,4 @@ def isPrime(n: int) -> bool:
     #### Returns:
         bool: Whether n is a prime number or not
     """
-    if n < 2:
-        return False
-    for i in range(2, int(n ** 0.5) + 1):
-        if n % i == 0:
-            return False
-    return True
\ No newline at end of file
+    return is_prime(n)
\ No newline at end of file
@@ -3,48 +3,338 @@ Module for stochastics
 """
 
 from random import randint
+from dataclasses import dataclass
+from bisect import bisect_right
+from functools import lru_cache
+import math
 
-def binomialDF(n: int, k: int, p: float, mode: str = "exact") -> float:
+import numpy as np
+
+from ametrine.library.rational import rational
+from ametrine.calc.combinatorics import binomial
+
+def binomialDF(n: int, k: int, p: float | rational, mode: str = "exact") -> float | rational:
     """
     Calculates a probability using the binomial distribution function
 
     #### Arguments
         n (int): Number of Bernoulli experiments performed
         k (int): Number of succesfull experiments
-        p (float): The probability of success of a single experiment
+        p (float | rational): The probability of success of a single experiment
         mode: "exact", "max", "min", "morethen" or "lessthen"
 
+    All arguments except `mode` can also be NumPy arrays, which are broadcast against each other.
+    If `p` is a `rational`, the probability is calculated exactly.
+
     #### Returns
-        float: The requested probability
+        float | rational: The requested probability, a `rational` if `p` is one
     """
-    def factorial(n: int) -> int:
-        out: int = 1
-        for i in range(1, n + 1):
-            out *= i
-        return out
-    def binominalC(n: int, k: int) -> float:
-        return factorial(n) / (factorial(k) * factorial(n - k))
-    def binominalD(n: int, k: int, p: float) -> float:
-        return binominalC(n, k) * (p ** k) * ((1-p) ** (n - k))
-    def bdf_max(n: int, k_max: int, p: float) -> float:
-        out: float = 0
-        for i in range(0, k_max + 1):
-            out = out + binominalD(n, i, p)
-        return out
-    
+    if isinstance(p, rational):
+        return _exact_binomialDF(n, k, p, mode)
+
+    if np.ndim(n) == np.ndim(k) == np.ndim(p) == 0 and 0 <= n <= _DIRECT_MAX_N and float(n).is_integer() and float(k).is_integer() and 0 <= p <= 1:
+        return _direct_binomialDF(int(n), int(k), float(p), mode)
+
+    distribution = BinomialDistribution(n, p)
+    match mode:
+        case "exact":
+            return distribution.pmf(k)
+        case "max":
+            return distribution.cdf(k)
+        case "min":
+            return distribution.sf(np.asarray(k) - 1)
+        case "morethen":
+            return distribution.sf(k)
+        case "lessthen":
+            return distribution.cdf(np.asarray(k) - 1)
+        case _:
+            raise SyntaxError("mode in binomialDF() must be one of 'exact', 'max', 'min', 'morethen' or 'lessthen'")
+
+# Bis zu dieser Anzahl an Experimenten summiert binomialDF einzelne Zahlen direkt, statt Arrays aufzubauen
+_DIRECT_MAX_N = 128
+
+def _direct_binomialDF(n: int, k: int, p: float, mode: str) -> float:
+    match mode:
+        case "exact":
+            terms = range(k, k + 1)
+        case "max":
+            terms = range(0, k + 1)
+        case "min":
+            terms = range(max(k, 0), n + 1)
+        case "morethen":
+            terms = range(max(k + 1, 0), n + 1)
+        case "lessthen":
+            terms = range(0, k)
+        case _:
+            raise SyntaxError("mode in binomialDF() must be one of 'exact', 'max', 'min', 'morethen' or 'lessthen'")
+    # Rundungsfehler der Summanden können die Summe knapp über 1 heben
+    return min(1.0, math.fsum(_direct_pmf(n, i, p) for i in terms if 0 <= i <= n))
+
+def _direct_pmf(n: int, k: int, p: float) -> float:
+    # im Logarithmus, damit p^k und (1-p)^(n-k) nicht einzeln unterlaufen
+    if p == 0 or p == 1:
+        return float(k == (0 if p == 0 else n))
+    return math.exp(math.log(binomial(n, k)) + k * math.log(p) + (n - k) * math.log1p(-p))
+
+def _exact_binomialDF(n: int, k: int, p: rational, mode: str) -> rational:
+    # Mit p = a/d und 1-p = b/d ist jeder Term C(n, i) a^i b^(n-i) / d^n,
+    # summiert wird also nur über ganze Zahlen und einmal durch d^n geteilt.
+    if not 0 <= p <= 1:
+        raise ValueError("p has to be between 0 and 1")
+    a, d = p.numerator, p.denominator
+    b = d - a
+    total = d ** n
+
     match mode:
         case "exact":
-            return binominalD(n, k, p)
+            numerator = binomial(n, k) * a ** k * b ** (n - k) if 0 <= k <= n else 0
         case "max":
-            out: float = 0
-            for i in range(0, k + 1):
-                out = out + binominalD(n, i, p)
-            return out
+            numerator = _exact_lower_sum(n, k, a, b)
         case "min":
-            return 1 - bdf_max(n, k - 1, p)
+            numerator = total - _exact_lower_sum(n, k - 1, a, b)
         case "morethen":
-            return 1 - bdf_max(n, k, p)
+            numerator = total - _exact_lower_sum(n, k, a, b)
         case "lessthen":
-            return bdf_max(n, k - 1, p)
+            numerator = _exact_lower_sum(n, k - 1, a, b)
         case _:
-            raise SyntaxError("mode in binomialDF() must be one of 'exact', 'max', 'min', 'morethen' or 'lessthen'") 
\ No newline at end of file
+            raise SyntaxError("mode in binomialDF() must be one of 'exact', 'max', 'min', 'morethen' or 'lessthen'")
+
+    return rational(numerator, total)
+
+def _exact_lower_sum(n: int, k: int, a: int, b: int) -> int:
+    "sum_{i=0}^{k} C(n, i) a^i b^(n-i)"
+    if k < 0:
+        return 0
+    if k >= n:
+        return (a + b) ** n
+    if k > n // 2:
+        # die kürzere Seite summieren: Terme mit i > k entsprechen j = n-i < n-k bei vertauschtem a und b
+        return (a + b) ** n - _exact_lower_sum(n, n - k - 1, b, a)
+    if b == 0:
+        return 0
+
+    # Quotientenrekursion T_{i+1} = T_i (n-i) a / ((i+1) b), die Division geht immer auf
+    term = b ** n
+    out = term
+    for i in range(k):
+        term = term * (n - i) * a // ((i + 1) * b)
+        out += term
+    return out
+
+@dataclass(frozen=True)
+class BinomialDistribution:
+    """
+    Binomial distribution B(n, p), evaluated in log-space so that large n neither overflow nor underflow
+
+    #### Arguments
+        n (int | array): Number of Bernoulli experiments performed
+        p (float | array): The probability of success of a single experiment
+
+    All methods accept NumPy arrays of k and broadcast them against n and p.
+    """
+    n: int | np.ndarray
+    p: float | np.ndarray
+
+    @property
+    def mean(self) -> float | np.ndarray:
+        return _scalar(np.asarray(self.n) * np.asarray(self.p))
+
+    @property
+    def variance(self) -> float | np.ndarray:
+        return _scalar(np.asarray(self.n) * np.asarray(self.p) * (1 - np.asarray(self.p)))
+
+    def logpmf(self, k) -> float | np.ndarray:
+        "ln P(X = k)"
+        return _scalar(binomial_logpmf(k, self.n, self.p))
+
+    def pmf(self, k) -> float | np.ndarray:
+        "P(X = k)"
+        return _scalar(np.exp(binomial_logpmf(k, self.n, self.p)))
+
+    def cdf(self, k) -> float | np.ndarray:
+        "P(X <= k)"
+        return _scalar(_tail_sums(k, self.n, self.p, upper=False))
+
+    def sf(self, k) -> float | np.ndarray:
+        "P(X > k), summed directly instead of computed as 1 - cdf(k)"
+        return _scalar(_tail_sums(k, self.n, self.p, upper=True))
+
+class BinomialSampler:
+    """
+    Draws random variates of the binomial distribution B(n, p) in bulk
+
+    Variates are drawn from a precomputed alias table (one uniform random number per variate), which is cached per (n, p).
+    Distributions too wide for a table fall back to NumPy's BTPE sampler.
+
+    #### Arguments
+        n (int): Number of Bernoulli experiments performed
+        p (float): The probability of success of a single experiment
+        seed (int | Generator | None): Seed or NumPy `Generator` for reproducible draws
+    """
+
+    def __init__(self, n: int, p: float, seed: int | np.random.Generator | None = None):
+        if n < 0 or not 0 <= p <= 1:
+            raise ValueError("BinomialSampler() needs n >= 0 and 0 <= p <= 1")
+        self.n = n
+        self.p = p
+        self.rng = np.random.default_rng(seed)
+        self._table = _alias_table(n, p)
+
+    def sample(self, size: int | tuple[int, ...] | None = None) -> int | np.ndarray:
+        "Draws `size` variates, a single `int` if no size is given"
+        if self._table is None:
+            draws = self.rng.binomial(self.n, self.p, size)
+        else:
+            lo, prob, alias = self._table
+            u = np.asarray(self.rng.random(size)) * len(prob)
+            index = np.minimum(u.astype(np.int64), len(prob) - 1)
+            draws = np.where(u - index < prob[index], index, alias[index]) + lo
+        return int(draws) if size is None else draws
+
+def binomial_samples(n: int, p: float, size: int | tuple[int, ...] | None = None, seed: int | np.random.Generator | None = None) -> int | np.ndarray:
+    "Draws `size` variates of B(n, p), see `BinomialSampler`"
+    return BinomialSampler(n, p, seed).sample(size)
+
+def bernoulli_samples(p: float, size: int | tuple[int, ...] | None = None, seed: int | np.random.Generator | None = None) -> bool | np.ndarray:
+    "Draws `size` outcomes of a Bernoulli experiment with success probability `p`"
+    draws = np.random.default_rng(seed).random(size) < p
+    return bool(draws) if size is None else draws
+
+# Alias-Tabellen decken mean ± (9σ + 120) ab, die Masse außerhalb liegt unter 1e-16
+_SAMPLING_SIGMAS = 9
+_SAMPLING_OFFSET = 120
+_MAX_ALIAS_TABLE_SIZE = 1 << 20
+
+@lru_cache(maxsize=64)
+def _alias_table(n: int, p: float) -> tuple[int, np.ndarray, np.ndarray] | None:
+    # Alias-Methode nach Vose: jede Spalte i wird mit prob[i] selbst, sonst als alias[i] gezogen
+    width = _SAMPLING_SIGMAS * math.sqrt(n * p * (1 - p)) + _SAMPLING_OFFSET
+    lo = max(0, int(n * p - width))
+    hi = min(n, int(n * p + width) + 1)
+    if hi - lo + 1 > _MAX_ALIAS_TABLE_SIZE:
+        return None
+
+    pmf = np.exp(binomial_logpmf(np.arange(lo, hi + 1), n, p))
+    size = len(pmf)
+    prob = (pmf * size / pmf.sum()).tolist()
+    alias = list(range(size))
+    small = [i for i, q in enumerate(prob) if q < 1]
+    large = [i for i, q in enumerate(prob) if q >= 1]
+    while small and large:
+        s, l = small.pop(), large.pop()
+        alias[s] = l
+        prob[l] += prob[s] - 1
+        (small if prob[l] < 1 else large).append(l)
+    for i in small + large:
+        prob[i] = 1.0
+
+    prob, alias = np.array(prob), np.array(alias, dtype=np.int64)
+    prob.setflags(write=False)
+    alias.setflags(write=False)
+    return lo, prob, alias
+
+# Terme außerhalb von mean ± (40σ + 2200) sind nach der Bernstein-Ungleichung kleiner als 1e-340
+_WINDOW_SIGMAS = 40
+_WINDOW_OFFSET = 2200
+
+# Fehler der Stirling-Formel ln(n!) - (n + 1/2) ln(n) + n - ln(2π)/2, für kleine n als Tabelle
+_STIRLERR_TABLE = np.array([0.0] + [math.lgamma(i + 1) - (i + 0.5) * math.log(i) + i - 0.5 * math.log(2 * math.pi) for i in range(1, 16)])
+
+def _stirlerr(n: np.ndarray) -> np.ndarray:
+    table = _STIRLERR_TABLE[np.clip(n, 0, 15).astype(int)]
+    m = np.maximum(n, 16)
+    m2 = m * m
+    series = (1/12 - (1/360 - (1/1260 - (1/1680 - 1/(1188 * m2)) / m2) / m2) / m2) / m
+    return np.where(n < 16, table, series)
+
+def _bd0(x: np.ndarray, m: np.ndarray) -> np.ndarray:
+    # x ln(x/m) + m - x, ohne Auslöschung für x ≈ m
+    with np.errstate(divide="ignore", invalid="ignore"):
+        direct = x * np.log(x / m) + m - x
+        v = (x - m) / (x + m)
+        series = (x - m) * v
+        term = 2 * x * v
+        v2 = v * v
+        for j in range(1, 16):
+            term = term * v2
+            series = series + term / (2 * j + 1)
+    return np.where(np.abs(x - m) < 0.1 * (x + m), series, direct)
+
+def binomial_logpmf(k, n, p) -> np.ndarray:
+    """ln P(X = k) for X ~ B(n, p), elementwise over the broadcast arrays; -inf outside the support
+
+    Uses Loader's saddle point expansion, which stays accurate to a few ulps even for very large n.
+    """
+    k, n, p = np.broadcast_arrays(np.asarray(k, dtype=float), np.asarray(n, dtype=float), np.asarray(p, dtype=float))
+    valid = (k >= 0) & (k <= n) & (k == np.floor(k))
+    k = np.clip(k, 0, n)
+    q = 1 - p
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inner = (
+            _stirlerr(n) - _stirlerr(k) - _stirlerr(n - k) - _bd0(k, n * p) - _bd0(n - k, n * q)
+            + 0.5 * np.log(n / (2 * np.pi * k * (n - k)))
+        )
+        out = np.where(k == 0, n * np.log1p(-p), np.where(k == n, n * np.log(p), inner))
+    return np.where(valid, out, -np.inf)
+
+# Größe der gepolsterten Matrix (Verteilung, k), in der _tail_sums viele Verteilungen auf einmal summiert
+_BATCH_SIZE = 1 << 20
+
+def _tail_sums(k, n, p, upper: bool) -> np.ndarray:
+    # Die PMF jeder verschiedenen Verteilung (n, p) wird nur einmal über ihr relevantes Fenster ausgewertet und kumuliert.
+    # Die Fenster liegen als Zeilen einer gepolsterten Matrix (Verteilung, k), nach Breite sortiert und in Stapel geteilt,
+    # sodass alle Verteilungen eines Stapels mit denselben Array-Operationen ausgewertet und alle k per Indexzugriff beantwortet werden.
+    k, n, p = np.broadcast_arrays(np.floor(np.asarray(k, dtype=float)), np.asarray(n, dtype=float), np.asarray(p, dtype=float))
+    shape = k.shape
+    k, n, p = k.ravel(), n.ravel(), p.ravel()
+
+    pairs, inverse = np.unique(np.stack([n, p], axis=1), axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    n_u, p_u = pairs[:, 0], pairs[:, 1]
+    valid = (n_u >= 0) & (p_u >= 0) & (p_u <= 1)
+    with np.errstate(invalid="ignore"):
+        width = _WINDOW_SIGMAS * np.sqrt(np.where(valid, n_u * p_u * (1 - p_u), 0)) + _WINDOW_OFFSET
+    lo = np.where(valid, np.maximum(0, np.floor(n_u * p_u - width)), 0)
+    hi = np.where(valid, np.minimum(n_u, np.floor(n_u * p_u + width) + 1), lo)
+    size = (hi - lo + 1).astype(np.int64)
+
+    # Verteilungen nach Fensterbreite sortieren, Anfragen nach der Position ihrer Verteilung
+    order = np.argsort(size, kind="stable")
+    position = np.empty_like(order)
+    position[order] = np.arange(len(order))
+    query_position = position[inverse]
+    queries = np.argsort(query_position, kind="stable")
+    sorted_position = query_position[queries]
+    sorted_size = size[order]
+
+    out = np.full(k.shape, np.nan)
+    start = 0
+    while start < len(order):
+        # so viele Zeilen, wie mit der breitesten von ihnen in die Matrix passen
+        rows = bisect_right(range(start + 1, len(order) + 1), _BATCH_SIZE, key=lambda stop: (stop - start) * int(sorted_size[stop - 1]))
+        stop = start + max(1, rows)
+        batch = order[start:stop]
+        columns = int(sorted_size[stop - 1])
+
+        # Spalten jenseits eines kürzeren Fensters enthalten nur weitere (vernachlässigbar kleine) Terme derselben Verteilung
+        window = lo[batch, None] + np.arange(columns)
+        pmf = np.exp(binomial_logpmf(window, n_u[batch, None], p_u[batch, None]))
+        zeros = np.zeros((len(batch), 1))
+        if upper:
+            # sums[r, j] = P(X >= lo + j), P(X > k) = sums[r, k + 1 - lo]
+            sums = np.concatenate([np.cumsum(pmf[:, ::-1], axis=1)[:, ::-1], zeros], axis=1)
+        else:
+            # sums[r, j + 1] = P(X <= lo + j), P(X <= k) = sums[r, k + 1 - lo]
+            sums = np.concatenate([zeros, np.cumsum(pmf, axis=1)], axis=1)
+
+        selected = queries[np.searchsorted(sorted_position, start):np.searchsorted(sorted_position, stop)]
+        distribution = inverse[selected]
+        index = np.clip(k[selected] + 1 - lo[distribution], 0, columns).astype(np.int64)
+        out[selected] = np.where(valid[distribution], sums[position[distribution] - start, index], np.nan)
+        start = stop
+
+    # Rundungsfehler der Teilsummen können knapp über 1 liegen, NaN bleibt erhalten
+    return np.clip(out, 0, 1).reshape(shape)
+
+def _scalar(value: np.ndarray) -> float | np.ndarray:
+    return float(value) if np.ndim(value) == 0 else value
@@ -0,0 +1,30 @@
+from functools import lru_cache
+import math
+
+def factorial(n: int) -> int:
+    "n! for a natural number n, computed by binary splitting of the odd parts (CPython's `math.factorial`)"
+    return math.factorial(n)
+
+def falling_factorial(n: int, k: int) -> int:
+    "n * (n-1) * ... * (n-k+1), zero if k > n"
+    return math.perm(n, k)
+
+def binomial(n: int, k: int) -> int:
+    "Binomial coefficient C(n, k), zero if k < 0 or k > n"
+    if k < 0 or k > n:
+        return 0
+    return math.comb(n, k)
+
+def multinomial(*ks: int) -> int:
+    "Multinomial coefficient (k_1 + ... + k_m)! / (k_1! * ... * k_m!), built from binomials to keep the intermediates small"
+    result, total = 1, 0
+    for k in ks:
+        if k < 0:
+            raise ValueError("multinomial() arguments must be natural numbers")
+        total += k
+        result *= math.comb(total, k)
+    return result
+
+# Für wiederholte Aufrufe mit denselben Argumenten
+factorial_cached = lru_cache(maxsize=256)(factorial)
+binomial_cached = lru_cache(maxsize=1024)(binomial)
@@ -1,5 +1,8 @@
 # Beispiel: funktioniert mit fractions.Fraction. 
 # Ersetze rat_factory durch deinen Rational-Konstruktor:
+import math
+from concurrent.futures import Executor, ProcessPoolExecutor
+
 from ametrine.library.rational import rational
 
 # Binary splitting für Terms (-1)^k / ((2k+1)*m^(2k+1))
@@ -12,41 +15,59 @@ def bs_arctan_range(m, a, b):
         Q = (2*a + 1) * pow(m, exp)
         return P, Q
     mid = (a + b) // 2
-    P1, Q1 = bs_arctan_range(m, a, mid)
-    P2, Q2 = bs_arctan_range(m, mid, b)
+    return merge_arctan(bs_arctan_range(m, a, mid), bs_arctan_range(m, mid, b))
+
+def merge_arctan(left, right):
     # (P1/Q1) + (P2/Q2) = (P1*Q2 + P2*Q1) / (Q1*Q2)
-    P = P1 * Q2 + P2 * Q1
-    Q = Q1 * Q2
-    return P, Q
+    P1, Q1 = left
+    P2, Q2 = right
+    return P1 * Q2 + P2 * Q1, Q1 * Q2
+
+def bs_arctan_range_parallel(m, a, b, depth, executor: Executor):
+    # wie bs_arctan_range, die 2^depth Teilbereiche laufen aber auf dem Executor
+    return parallel_binary_splitting(bs_arctan_range, merge_arctan, (m,), a, b, depth, executor)
 
-def arctan_rational(m, terms):
+def arctan_rational(m, terms, depth=0, executor: Executor | None = None):
     # berechnet arctan(1/m) als rat(P, Q)
-    P, Q = bs_arctan_range(m, 0, terms)
+    if executor is not None and depth > 0:
+        P, Q = bs_arctan_range_parallel(m, 0, terms, depth, executor)
+    else:
+        P, Q = bs_arctan_range(m, 0, terms)
     return rational(P, Q)
 
-import math
 def terms_needed_for_m(m, n_digits):
-    # grobe Abschätzung: nächster Term < 10^{-n_digits-1}
-    # Term_k ≈ 1/((2k+1)*m^{2k+1}) <= 10^{-(n_digits+1)}
-    # Löse grob nach k per log. Wir iterieren bis Bedingung erfüllt.
-    target = 10 ** (-(n_digits + 1))
-    k = 0
-    while True:
-        bound = 1.0 / ((2*k+1) * (m ** (2*k+1)))
-        if bound < target:
-            return k + 1  # Anzahl Terme = k+1
+    # kleinstes k mit Term_k ≈ 1/((2k+1)*m^{2k+1}) < 10^{-(n_digits+1)}
+    # Startwert per Logarithmus, danach exakt mit Ganzzahlen korrigiert (keine Float-Überläufe)
+    target = 10 ** (n_digits + 1)
+    exceeds = lambda k: (2*k+1) * m ** (2*k+1) > target
+    k = max(0, int(((n_digits + 1) / math.log10(m) - 1) / 2))
+    while k > 0 and exceeds(k - 1):
+        k -= 1
+    while not exceeds(k):
         k += 1
+    return k + 1  # Anzahl Terme = k+1
 
-def compute_pi(n_digits):
+def compute_pi(n_digits, processes: int | None = None, parallel_depth: int | None = None):
     # n_digits: Anzahl gewünschter Dezimalstellen
-    # rat_factory(num, den=1) -> dein Rational
     # liefert rationale Approximation von pi, korrekt auf n_digits
     # Machin: pi = 4*(4*arctan(1/5) - arctan(1/239))
+    # processes: beide Reihen werden gleichzeitig in einem Prozesspool berechnet,
+    # jeweils aufgeteilt in 2^parallel_depth Teilbereiche (Standard: genug für alle Prozesse)
     m1, m2 = 5, 239
     t1 = terms_needed_for_m(m1, n_digits)
     t2 = terms_needed_for_m(m2, n_digits)
-    A1 = arctan_rational(m1, t1)   # arctan(1/5)
-    A2 = arctan_rational(m2, t2)   # arctan(1/239)
+    if processes is not None and processes > 1:
+        if parallel_depth is None:
+            parallel_depth = (processes - 1).bit_length()
+        with ProcessPoolExecutor(processes) as executor:
+            # erst beide Reihen einreichen, dann einsammeln, damit sie parallel laufen
+            F1 = submit_binary_splitting(bs_arctan_range, (m1,), 0, t1, parallel_depth, executor)
+            F2 = submit_binary_splitting(bs_arctan_range, (m2,), 0, t2, parallel_depth, executor)
+            A1 = rational(*collect_binary_splitting(F1, merge_arctan))   # arctan(1/5)
+            A2 = rational(*collect_binary_splitting(F2, merge_arctan))   # arctan(1/239)
+    else:
+        A1 = arctan_rational(m1, t1)   # arctan(1/5)
+        A2 = arctan_rational(m2, t2)   # arctan(1/239)
     # pi = 4 * (4*A1 - A2)
     four = rational(4)
     pi_rat = four * ( four * A1 - A2 )
@@ -60,4 +81,109 @@ def leibniz_formula(i: int) -> rational:
 
 def machins_formula(i: int) -> rational:
     from ametrine.calc.trig import gregorys_series
-    return 4 * (4 * gregorys_series(rational(1, 5), i) - gregorys_series(rational(1, 239), i))
\ No newline at end of file
+    return 4 * (4 * gregorys_series(rational(1, 5), i) - gregorys_series(rational(1, 239), i))
+
+
+# ── Chudnovsky ────────────────────────────────────────────────────────────────
+# pi = 426880 * sqrt(10005) * Q(0, N) / T(0, N), jeder Term liefert ~14.18 Stellen
+
+CHUDNOVSKY_DIGITS_PER_TERM = math.log10(640320**3 / (24 * 6 * 2 * 6))
+_C3_OVER_24 = 640320**3 // 24
+_GUARD_DIGITS = 10
+
+# bester bisher berechneter Zustand: (Anzahl Terme, P, Q, T) über die Terme [0, Anzahl)
+_chudnovsky_state: tuple[int, int, int, int] = (0, 1, 1, 0)
+
+def bs_chudnovsky_range(a, b):
+    # gibt (P, Q, T) als Python ints für die Terme a..b-1 zurück
+    if b - a == 1:
+        if a == 0:
+            P = Q = 1
+        else:
+            P = (6*a - 5) * (2*a - 1) * (6*a - 1)
+            Q = a * a * a * _C3_OVER_24
+        T = P * (13591409 + 545140134 * a)
+        if a & 1:
+            T = -T
+        return P, Q, T
+    mid = (a + b) // 2
+    return merge_chudnovsky(bs_chudnovsky_range(a, mid), bs_chudnovsky_range(mid, b))
+
+def merge_chudnovsky(left, right):
+    # fasst (P, Q, T) zweier aufeinanderfolgender Bereiche zusammen
+    P1, Q1, T1 = left
+    P2, Q2, T2 = right
+    return P1 * P2, Q1 * Q2, T1 * Q2 + P1 * T2
+
+def split_range(a, b, depth):
+    # teilt [a, b) in bis zu 2^depth zusammenhängende Teilbereiche
+    ranges = [(a, b)]
+    for _ in range(depth):
+        ranges = [half for lo, hi in ranges for half in ((lo, (lo + hi) // 2), ((lo + hi) // 2, hi)) if half[0] < half[1]]
+    return ranges
+
+def merge_tree(parts, merge):
+    # balancierte Zusammenführung, damit die großen Multiplikationen gleich groß bleiben
+    while len(parts) > 1:
+        parts = [merge(parts[i], parts[i+1]) if i + 1 < len(parts) else parts[i] for i in range(0, len(parts), 2)]
+    return parts[0]
+
+def submit_binary_splitting(leaf, args, a, b, depth, executor: Executor):
+    # verteilt die Teilbereiche auf den Executor
+    return [executor.submit(leaf, *args, lo, hi) for lo, hi in split_range(a, b, depth)]
+
+def collect_binary_splitting(futures, merge):
+    # die Zusammenführung der großen Zahlen erfolgt im Elternprozess
+    return merge_tree([f.result() for f in futures], merge)
+
+def parallel_binary_splitting(leaf, merge, args, a, b, depth, executor: Executor):
+    return collect_binary_splitting(submit_binary_splitting(leaf, args, a, b, depth, executor), merge)
+
+def chudnovsky_terms(n_digits):
+    return int(n_digits / CHUDNOVSKY_DIGITS_PER_TERM) + 2
+
+def _chudnovsky(terms, processes=None):
+    # erweitert den gespeicherten Zustand, sodass er mindestens `terms` Terme umfasst
+    global _chudnovsky_state
+    cached_terms, P, Q, T = _chudnovsky_state
+    if cached_terms >= terms:
+        return Q, T
+
+    if processes is not None and processes > 1:
+        depth = (processes - 1).bit_length()
+        with ProcessPoolExecutor(processes) as executor:
+            extension = parallel_binary_splitting(bs_chudnovsky_range, merge_chudnovsky, (), cached_terms, terms, depth, executor)
+    else:
+        extension = bs_chudnovsky_range(cached_terms, terms)
+
+    P, Q, T = merge_chudnovsky((P, Q, T), extension)
+    _chudnovsky_state = (terms, P, Q, T)
+    return Q, T
+
+def _pi_scaled(n_digits, processes=None):
+    # floor(pi * 10^n_digits)
+    Q, T = _chudnovsky(chudnovsky_terms(n_digits + _GUARD_DIGITS), processes)
+    one = 10 ** (n_digits + _GUARD_DIGITS)
+    sqrt_10005 = math.isqrt(10005 * one * one)
+    return (426880 * sqrt_10005 * Q // T) // 10 ** _GUARD_DIGITS
+
+def _int_to_digits(n, width):
+    # Teile-und-herrsche statt str(n), das für große Zahlen quadratisch und auf 4300 Stellen begrenzt ist
+    if width <= 2000:
+        return str(n).zfill(width)
+    half = width // 2
+    hi, lo = divmod(n, 10 ** half)
+    return _int_to_digits(hi, width - half) + _int_to_digits(lo, half)
+
+def pi_rational(n_digits: int, processes: int | None = None) -> rational:
+    """Returns pi truncated to `n_digits` decimals, computed with the Chudnovsky series by binary splitting.
+
+    Previously computed terms are kept, so later requests for more digits only compute the missing terms.
+    With `processes` the new terms are split across a process pool, which pays off for millions of digits.
+    """
+    return rational(_pi_scaled(n_digits, processes), 10 ** n_digits)
+
+def pi_digits(n_digits: int, processes: int | None = None) -> str:
+    "Returns pi as a string with `n_digits` decimals, like `pi_rational`."
+    digits = _int_to_digits(_pi_scaled(n_digits, processes), n_digits + 1)
+    return digits[0] + "." + digits[1:] if n_digits > 0 else digits
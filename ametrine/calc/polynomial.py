@@ -1,49 +1,223 @@
-from decimal import Decimal, getcontext
+from decimal import Context, Decimal, localcontext
+from fractions import Fraction
+from math import ceil, lcm, log10
 from ametrine.typing import PolynomialCoefficients
-import cmath
+import numpy as np
+
+_EPS = np.finfo(float).eps
+_GUARD_DIGITS = 10
+_MAX_PRECISION_RAISES = 4
+
+DecimalComplex = tuple[Decimal, Decimal]
+"Komplexe Zahl als (Realteil, Imaginärteil)"
 
 def polynomial_roots(coeffs: PolynomialCoefficients, precision: int = 30):
     """
     Berechnet alle (komplexen) Wurzeln eines Polynoms
     a_0 + a_1*x + ... + a_n*x^n = 0
-    mit Durand-Kerner-Verfahren auf n Nachkommastellen genau.
+    mit dem Aberth-Ehrlich-Verfahren in float64, gerundet auf `precision` Nachkommastellen.
+    Mehr als ~15 Stellen sind in float64 nicht erreichbar, dafür gibt es `polynomial_roots_precise`.
     """
-    getcontext().prec = precision + 5  # etwas Sicherheitsreserve
-
-    n = len(coeffs) - 1
-    if n < 1:
+    if len(coeffs) - 1 < 1:
         raise ValueError("Mindestens ein Koeffizient ungleich Null nötig")
 
-    # in komplexe Koeffizienten umwandeln
-    coeffs = [complex(Decimal(c)) for c in coeffs]
-
-    def P(x):
-        """Polynomwert P(x)"""
-        s = complex(0)
-        for i, a in enumerate(coeffs):
-            s += a * (x ** i)
-        return s
-
-    # Startwerte gleichmäßig auf dem Einheitskreis
-    roots = [complex(cmath.exp(2j * cmath.pi * k / n)) for k in range(n)]
-
-    # Iteration
-    for _ in range(precision * 5):  # max. Iterationen
-        new_roots = []
-        for i, x in enumerate(roots):
-            denom = 1
-            for j, y in enumerate(roots):
-                if i != j:
-                    denom *= (x - y)
-            new_x = x - P(x) / denom
-            new_roots.append(new_x)
-        if max(abs(new_roots[i] - roots[i]) for i in range(n)) < Decimal(10) ** (-precision):
-            break
-        roots = new_roots
+    roots = polynomial_roots_batch([coeffs], tol=10.0 ** (-precision))[0]
 
     # gerundete Ausgabe
     rounded = [
         complex(round(r.real, precision), round(r.imag, precision))
         for r in roots
     ]
-    return rounded
\ No newline at end of file
+    return rounded
+
+def polynomial_roots_batch(coeffs, tol: float = 1e-14, max_iterations: int = 500) -> np.ndarray:
+    """
+    Berechnet die Wurzeln vieler Polynome gleichen Grades auf einmal.
+    coeffs: Array der Form (Anzahl, n+1), jede Zeile aufsteigend [a_0, ..., a_n] mit a_n != 0
+    Gibt ein komplexes Array der Form (Anzahl, n) zurück.
+    """
+    coeffs = np.atleast_2d(np.asarray(coeffs, dtype=complex))
+    n = coeffs.shape[1] - 1
+    if n < 1:
+        raise ValueError("Mindestens ein Koeffizient ungleich Null nötig")
+    if (coeffs[:, -1] == 0).any():
+        raise ValueError("Der höchste Koeffizient darf nicht Null sein")
+
+    roots = _initial_guesses(coeffs)
+    if n == 1:
+        return -coeffs[:, :1] / coeffs[:, 1:]
+
+    active = np.ones(roots.shape, dtype=bool)
+    off_diagonal = ~np.eye(n, dtype=bool)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(max_iterations):
+            p, dp = _horner(coeffs, roots)
+            ratio = p / dp
+
+            # Abstoßung durch die übrigen Wurzeln: sum_{j != i} 1 / (z_i - z_j)
+            diff = roots[:, :, None] - roots[:, None, :]
+            repulsion = np.where(off_diagonal, 1 / np.where(off_diagonal, diff, 1), 0).sum(axis=-1)
+
+            step = ratio / (1 - ratio * repulsion)
+            step = np.where(active & np.isfinite(step), step, 0)
+            roots = roots - step
+
+            # bereits konvergierte Wurzeln werden nicht mehr verschoben
+            active &= np.abs(step) > max(tol, 4 * _EPS) * np.maximum(1, np.abs(roots))
+            if not active.any():
+                break
+
+    return roots
+
+def polynomial_roots_precise(coeffs: PolynomialCoefficients, precision: int = 30) -> list[DecimalComplex]:
+    """
+    Berechnet alle (komplexen) Wurzeln eines Polynoms auf `precision` Nachkommastellen genau.
+    Zuerst werden alle Wurzeln in float64 geschätzt, danach wird jede einzeln mit dem Newton-Verfahren
+    in `Decimal` verfeinert, wobei sich die Rechengenauigkeit mit jedem Schritt verdoppelt.
+    Mehrfache Wurzeln werden am quadratfreien Teil des Polynoms verfeinert und entsprechend ihrer Vielfachheit wiederholt zurückgegeben.
+    Der globale `decimal`-Kontext bleibt unverändert.
+    """
+    estimates = polynomial_roots_batch([coeffs])[0]
+    squarefree = _squarefree(coeffs)
+    return [_refine(squarefree, complex(estimate), precision) for estimate in estimates]
+
+def refine_root(coeffs: PolynomialCoefficients, estimate: complex, precision: int = 30) -> DecimalComplex:
+    """
+    Verfeinert eine Schätzung einer Wurzel mit dem Newton-Verfahren auf `precision` Nachkommastellen.
+    Jeder Newton-Schritt verdoppelt (bei einfachen Wurzeln) die Anzahl korrekter Stellen,
+    daher wird nur der letzte Schritt in voller Genauigkeit gerechnet.
+    Mehrfache Wurzeln werden am quadratfreien Teil des Polynoms verfeinert, an dem sie einfach sind.
+
+    Raises
+    ----------
+    ArithmeticError : Wenn die Wurzel so schlecht konditioniert ist, dass `precision` Stellen nicht sicher erreichbar sind, oder die Ableitung an ihr verschwindet
+    """
+    return _refine(_squarefree(coeffs), estimate, precision)
+
+def _refine(coeffs: list[int], estimate: complex, precision: int) -> DecimalComplex:
+    magnitude = max(0, int(log10(abs(estimate))) + 1) if estimate else 0
+    target = precision + magnitude + _GUARD_DIGITS
+    working = target
+
+    # eigener Kontext statt einer Kopie des globalen, dessen Genauigkeit und Traps beliebig sein können
+    with localcontext(Context(prec=16)) as ctx:
+        coeffs = [Decimal(c) for c in coeffs]
+
+        # eng beieinander liegende Wurzeln verlieren Stellen: die Rechengenauigkeit wird um die Kondition der Wurzel erhöht
+        for _ in range(_MAX_PRECISION_RAISES):
+            ctx.prec = 16
+            x = (Decimal(estimate.real), Decimal(estimate.imag))
+
+            digits = 16
+            while digits < working:
+                digits = min(2 * digits, working)
+                ctx.prec = digits
+                x, _ = _newton_step(coeffs, x)
+            ctx.prec = max(working, 16)
+
+            # konvergiert Newton doch nur linear, wird begrenzt nachiteriert
+            tolerance = Decimal(10) ** -(precision + _GUARD_DIGITS // 2)
+            for _ in range(4 * working):
+                x, step = _newton_step(coeffs, x)
+                if step is None or step <= tolerance:
+                    break
+
+            needed = target + _lost_digits(coeffs, x)
+            if needed <= working:
+                quantum = Decimal(10) ** -precision
+                return (+x[0].quantize(quantum), +x[1].quantize(quantum))
+            working = needed
+
+    raise ArithmeticError(f"Die Wurzel bei {estimate} ist zu schlecht konditioniert, um sie auf {precision} Stellen zu bestimmen")
+
+def _lost_digits(coeffs: list[Decimal], x: DecimalComplex) -> int:
+    "Stellen, die bei der Auswertung des Polynoms an der Wurzel x verloren gehen: log10(sum |a_i| |x|^i / |P'(x)|)"
+    zero = Decimal(0)
+    radius = (x[0] * x[0] + x[1] * x[1]).sqrt()
+    scale, dp = zero, (zero, zero)
+    p = (coeffs[-1], zero)
+    for a in reversed(coeffs[:-1]):
+        dp = _cadd(_cmul(dp, x), p)
+        p = _cadd(_cmul(p, x), (a, zero))
+    for a in reversed(coeffs):
+        scale = scale * radius + abs(a)
+    if scale == 0:
+        # exakte Wurzel bei 0 (z.B. ohne Absolutglied): die Auswertung verliert keine Stellen
+        return 0
+    slope = (dp[0] * dp[0] + dp[1] * dp[1]).sqrt()
+    if slope == 0:
+        raise ArithmeticError(f"Die Ableitung verschwindet an der Wurzel bei {complex(float(x[0]), float(x[1]))}, ihre Kondition ist unbestimmt")
+    return max(0, ceil((scale / slope).log10()))
+
+def _squarefree(coeffs: PolynomialCoefficients) -> list[int]:
+    "Ganzzahlige Koeffizienten von P / ggT(P, P'), das dieselben Wurzeln wie P hat, aber jede nur einfach"
+    p = [Fraction(c) for c in coeffs]
+    while len(p) > 1 and p[-1] == 0:
+        p.pop()
+    derivative = [i * c for i, c in enumerate(p)][1:]
+    quotient, _ = _divmod(p, _gcd(p, derivative))
+    denominators = lcm(*(c.denominator for c in quotient))
+    return [int(c * denominators) for c in quotient]
+
+def _gcd(u: list[Fraction], v: list[Fraction]) -> list[Fraction]:
+    "Normierter größter gemeinsamer Teiler zweier Polynome (aufsteigende Koeffizienten) mit dem euklidischen Algorithmus"
+    while v:
+        _, remainder = _divmod(u, v)
+        u, v = v, remainder
+    return [c / u[-1] for c in u]
+
+def _divmod(u: list[Fraction], v: list[Fraction]) -> tuple[list[Fraction], list[Fraction]]:
+    "Polynomdivision mit Rest, exakt in Brüchen; der Rest hat keine führenden Nullen"
+    remainder = list(u)
+    quotient = [Fraction(0)] * max(1, len(u) - len(v) + 1)
+    for shift in range(len(u) - len(v), -1, -1):
+        factor = remainder[shift + len(v) - 1] / v[-1]
+        quotient[shift] = factor
+        for i, c in enumerate(v):
+            remainder[shift + i] -= factor * c
+    remainder = remainder[:len(v) - 1]
+    while remainder and remainder[-1] == 0:
+        remainder.pop()
+    return quotient, remainder
+
+def _newton_step(coeffs: list[Decimal], x: DecimalComplex) -> tuple[DecimalComplex, Decimal | None]:
+    "Ein Newton-Schritt x - P(x)/P'(x) in komplexer Decimal-Arithmetik, zusammen mit der (Maximums-)Norm des Schritts"
+    zero = Decimal(0)
+    p, dp = (coeffs[-1], zero), (zero, zero)
+    for a in reversed(coeffs[:-1]):
+        dp = _cadd(_cmul(dp, x), p)
+        p = _cadd(_cmul(p, x), (a, zero))
+    if dp == (zero, zero):
+        return x, None
+    step = _cdiv(p, dp)
+    return (x[0] - step[0], x[1] - step[1]), max(abs(step[0]), abs(step[1]))
+
+def _cadd(u: DecimalComplex, v: DecimalComplex) -> DecimalComplex:
+    return (u[0] + v[0], u[1] + v[1])
+
+def _cmul(u: DecimalComplex, v: DecimalComplex) -> DecimalComplex:
+    return (u[0] * v[0] - u[1] * v[1], u[0] * v[1] + u[1] * v[0])
+
+def _cdiv(u: DecimalComplex, v: DecimalComplex) -> DecimalComplex:
+    norm = v[0] * v[0] + v[1] * v[1]
+    return ((u[0] * v[0] + u[1] * v[1]) / norm, (u[1] * v[0] - u[0] * v[1]) / norm)
+
+def _horner(coeffs: np.ndarray, x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    "Werte P(x) und P'(x) für jede Zeile von `coeffs` an allen Stellen der entsprechenden Zeile von `x` aus"
+    p = np.repeat(coeffs[:, -1:], x.shape[1], axis=1)
+    dp = np.zeros_like(x)
+    for i in range(coeffs.shape[1] - 2, -1, -1):
+        dp = dp * x + p
+        p = p * x + coeffs[:, i:i+1]
+    return p, dp
+
+def _initial_guesses(coeffs: np.ndarray) -> np.ndarray:
+    "Startwerte auf einem Kreis mit dem Radius der Fujiwara-Schranke, leicht gedreht, um symmetrische Stillstände zu vermeiden"
+    n = coeffs.shape[1] - 1
+    scaled = np.abs(coeffs[:, :-1] / coeffs[:, -1:])
+    exponents = 1 / (n - np.arange(n))
+    radius = 2 * (scaled ** exponents).max(axis=1)
+    radius = np.where(radius > 0, radius, 1)
+    angles = 2 * np.pi * np.arange(n) / n + 0.4
+    return radius[:, None] * np.exp(1j * angles)[None, :]
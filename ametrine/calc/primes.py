@@ -0,0 +1,178 @@
+from bisect import bisect_right
+from itertools import compress, count
+from math import gcd, isqrt
+
+# Für n < 3.3 * 10^24 (also alle 64-Bit-Zahlen) ist Miller-Rabin mit diesen Basen deterministisch
+_MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+class PrimeSieve:
+    """Sieve of Eratosthenes that grows lazily in segments, storing one flag per number in a `bytearray`.
+
+    Numbers beyond `max_limit` are not sieved, but tested with Miller-Rabin and factorized with Pollard's rho.
+    """
+
+    def __init__(self, limit: int = 1 << 16, max_limit: int = 1 << 24):
+        self.max_limit = max_limit
+        self._flags = bytearray(2)
+        self._primes: list[int] = []
+        self._extend(limit)
+
+    @property
+    def limit(self) -> int:
+        "All numbers below this limit are sieved"
+        return len(self._flags)
+
+    def _extend(self, limit: int) -> None:
+        # siebt nur das neue Segment [alte Grenze, limit) mit den bereits bekannten Primzahlen
+        while len(self._flags) < limit:
+            start = len(self._flags)
+            # die bekannten Primzahlen (< start) reichen für alle Zahlen < start²
+            end = min(max(limit, 2 * start), start * start)
+            root = isqrt(end - 1)
+
+            segment = bytearray(b"\x01") * (end - start)
+            for p in self._primes:
+                if p > root:
+                    break
+                first = max(p * p, -(-start // p) * p)
+                segment[first - start::p] = bytes(len(range(first - start, end - start, p)))
+
+            self._flags += segment
+            self._primes.extend(compress(range(start, end), segment))
+
+    def is_prime(self, n: int) -> bool:
+        if n < 2:
+            return False
+        if n < self.limit:
+            return bool(self._flags[n])
+        if n < self.max_limit:
+            self._extend(n + 1)
+            return bool(self._flags[n])
+        return _miller_rabin(n)
+
+    def primes_up_to(self, n: int) -> list[int]:
+        "All primes p <= n"
+        self._extend(n + 1)
+        return self._primes[:bisect_right(self._primes, n)]
+
+    def prime_pi(self, n: int) -> int:
+        "Number of primes p <= n"
+        self._extend(n + 1)
+        return bisect_right(self._primes, n)
+
+    def nth_prime(self, k: int) -> int:
+        "The k-th prime, counting from `nth_prime(1) == 2`"
+        if k < 1:
+            raise ValueError("k has to be positive")
+        while len(self._primes) < k:
+            self._extend(2 * self.limit)
+        return self._primes[k - 1]
+
+    def factorize(self, n: int) -> dict[int, int]:
+        "Prime factorization of |n| as a dict of prime and multiplicity"
+        n = abs(n)
+        if n == 0:
+            raise ValueError("0 has no prime factorization")
+
+        factors: dict[int, int] = {}
+        # Probedivision mit den bereits gesiebten Primzahlen, der Rest per Pollard-Rho
+        root = isqrt(n)
+        for p in self._primes:
+            if p > root:
+                break
+            if n % p == 0:
+                e = 0
+                while n % p == 0:
+                    n //= p
+                    e += 1
+                factors[p] = e
+                root = isqrt(n)
+
+        if n > 1:
+            for p in self._split(n):
+                factors[p] = factors.get(p, 0) + 1
+        return dict(sorted(factors.items()))
+
+    def _split(self, n: int) -> list[int]:
+        # zerlegt n ohne kleine Primfaktoren rekursiv mit Pollard-Rho
+        if (self._flags[n] if n < self.limit else _miller_rabin(n)):
+            return [n]
+        d = _pollard_brent(n)
+        return self._split(d) + self._split(n // d)
+
+    def divisors(self, n: int) -> list[int]:
+        "All positive divisors of |n| in ascending order, none for 0"
+        if n == 0:
+            return []
+        divisors = [1]
+        for p, e in self.factorize(n).items():
+            divisors = [d * p ** i for d in divisors for i in range(e + 1)]
+        return sorted(divisors)
+
+def _miller_rabin(n: int) -> bool:
+    for p in _MILLER_RABIN_BASES:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _MILLER_RABIN_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+def _pollard_brent(n: int) -> int:
+    "Liefert einen nichttrivialen Teiler einer zusammengesetzten Zahl n (Pollard-Rho nach Brent)"
+    if n % 2 == 0:
+        return 2
+    for c in count(1):
+        y, r, q, g = 2, 1, 1, 1
+        m = 128
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = gcd(abs(x - ys), n)
+        if g != n:
+            return g
+
+_sieve = PrimeSieve()
+
+def is_prime(n: int) -> bool:
+    return _sieve.is_prime(n)
+
+def primes_up_to(n: int) -> list[int]:
+    return _sieve.primes_up_to(n)
+
+def prime_pi(n: int) -> int:
+    return _sieve.prime_pi(n)
+
+def nth_prime(k: int) -> int:
+    return _sieve.nth_prime(k)
+
+def factorize(n: int) -> dict[int, int]:
+    return _sieve.factorize(n)
+
+def divisors(n: int) -> list[int]:
+    return _sieve.divisors(n)
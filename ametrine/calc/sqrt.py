@@ -1,12 +1,16 @@
-from math import isqrt, gcd
+from math import gcd
+
+from ametrine.calc.primes import factorize
 
 def simplify_sqrt_div(n, denom):
         """Vereinfacht sqrt(n)/denom zu k*sqrt(r)/d"""
         k = 1
-        for i in range(2, isqrt(n)+1):
-            while n % (i*i) == 0:
-                n //= i*i
-                k *= i
+        if n > 1:
+            r = 1
+            for p, e in factorize(n).items():
+                k *= p ** (e // 2)
+                r *= p ** (e % 2)
+            n = r
         g = gcd(k, denom)
         k //= g
         denom //= g
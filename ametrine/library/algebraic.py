@@ -4,6 +4,7 @@ from dataclasses import dataclass, field
 from ametrine.library.rational import rational, rationalComprehendable
 from ametrine.library.numeric import ExactNumber
 from ametrine.typing import PolynomialCoefficients
+from ametrine.calc.primes import divisors
 
 @dataclass
 class algebraic(ExactNumber):
@@ -103,10 +104,6 @@ def rational_root_candidates(coeffs: PolynomialCoefficients) -> List['rational']
     a0 = coeffs[0]
     an = coeffs[-1]
 
-    def divisors(n):
-        n = abs(n)
-        return [i for i in range(1, n+1) if n % i == 0]
-
     ps = divisors(a0)
     qs = divisors(an)
 
@@ -116,14 +113,7 @@ def rational_root_candidates(coeffs: PolynomialCoefficients) -> List['rational']
             candidates.append(rational(p, q))
             candidates.append(rational(-p, q))
     # Eindeutige Kandidaten
-    seen = set()
-    unique_candidates = []
-    for c in candidates:
-        key = (c.numerator, c.denominator)
-        if key not in seen:
-            seen.add(key)
-            unique_candidates.append(c)
-    return unique_candidates
+    return list(dict.fromkeys(candidates))
 
 
 def find_real_algebraic_roots(coeffs: PolynomialCoefficients) -> List[Union['rational','algebraic']]:
@@ -2,6 +2,7 @@ from __future__ import annotations
 from typing import Self, Any
 
 class ExactNumber:
+    __slots__ = ()
 
     _immutable = False
     def __setattr__(self, name, value):
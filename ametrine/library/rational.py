@@ -1,15 +1,17 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import TypeAlias
+from dataclasses import dataclass, field
+from typing import TypeAlias, Iterator
 
-from math import gcd, frexp
+from math import gcd, lcm, frexp
+from sys import hash_info
 
 from ametrine.library.numeric import ExactNumber
 from ametrine.ausgelagert import simplify
 from ametrine.typing import Digit
+from ametrine.calc.primes import factorize
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, frozen=True, slots=True)
 class rational(ExactNumber):
     """Type, storing a rational number, meaning that it is arithmetically displayable by an division of two integers.
     
@@ -18,23 +20,31 @@ class rational(ExactNumber):
     - `+`, `-`, `*`, `/` for all `rational` and `rationalComprehendable` numbers
     - `**` as long as the exponent is an integer
     - `==`, `<`, `>`, `<=`, `>=`
+    - `hash()`, consistent with `int`, `float` and `fractions.Fraction` of the same value
+
+    Instances are immutable.
     """
     numerator:      int
     denominator:    int = 1
+    _hash:          int | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if not isinstance(self.numerator, int) or not isinstance(self.denominator, int):
             raise TypeError("Please ensure to instantiate `raional` type only with integers")
 
-        if self.denominator == 0:
+        numerator, denominator = self.numerator, self.denominator
+        if denominator == 0:
             raise ValueError("Denominator can't be zero")
-        elif self.denominator < 0:
-            self.numerator = - self.numerator
-            self.denominator = - self.denominator
+        elif denominator < 0:
+            numerator = - numerator
+            denominator = - denominator
         
-        g = gcd(self.numerator, self.denominator)
-        self.numerator = self.numerator // g
-        self.denominator = self.denominator // g
+        g = gcd(numerator, denominator)
+        if g != 1:
+            numerator //= g
+            denominator //= g
+        object.__setattr__(self, "numerator", numerator)
+        object.__setattr__(self, "denominator", denominator)
 
     @classmethod
     def comprehend(cls, obj: rationalComprehendable) -> rational:
@@ -57,8 +67,10 @@ class rational(ExactNumber):
         elif isinstance(obj, float):
             n, d = rational_parts_from_float(obj)
             return cls(n, d).round(15)
+        elif type(obj) is cls:
+            return obj
         elif isinstance(obj, rational):
-            return cls(obj.numerator, obj.denominator)
+            return cls._from_coprime(obj.numerator, obj.denominator)
         elif isinstance(obj, str):
             if "." in obj:
                 objWhole, objFrac = obj.split(".", 1)
@@ -69,6 +81,20 @@ class rational(ExactNumber):
         else:
             raise TypeError(f"Cannot convert type to 'rational': '{type(obj).__name__}'")
 
+    @classmethod
+    def _from_coprime(cls, numerator: int, denominator: int) -> rational:
+        "Creates an instance from an already reduced fraction with a positive denominator, skipping the validation of `__post_init__`."
+        obj = object.__new__(cls)
+        object.__setattr__(obj, "numerator", numerator)
+        object.__setattr__(obj, "denominator", denominator)
+        object.__setattr__(obj, "_hash", None)
+        return obj
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            object.__setattr__(self, "_hash", _hash_fraction(self.numerator, self.denominator))
+        return self._hash
+
     def _repr(self) -> str:
         if self.denominator == 1:
             return str(self.numerator)
@@ -87,23 +113,17 @@ class rational(ExactNumber):
         )
 
     def round(self, precision: int) -> rational:
-        "Returns a new instance of the rational, rounded to `precision` decimals."
-        whole, non_repeating, repeating = self.to_decimal_parts()
-        decimals = "".join([str(d) for d in non_repeating]) + "".join([str(d) for d in repeating]) * (precision + 1)
-        if precision >= len(decimals):
-            return rational(self.numerator, self.denominator)
-
-        nDecimals = decimals[:precision]
-
-        if int(decimals[precision]) >= 5:
-
-            nDecimals_list = list(nDecimals)
-            nDecimals_list[-1] = str(int(nDecimals_list[-1]) + 1)
-            nDecimals = "".join(nDecimals_list)
-
-        return rational.comprehend(str(whole) + "." + nDecimals)
+        "Returns a new instance of the rational, rounded to `precision` decimals (half away from zero)."
+        q, r = divmod(abs(self.numerator) * 10 ** precision, self.denominator)
+        if 2 * r >= self.denominator:
+            q += 1
+        return rational(-q if self.numerator < 0 else q, 10 ** precision)
     
     def __add__(self, other):
+        if type(other) is rational:
+            return _add(self.numerator, self.denominator, other.numerator, other.denominator)
+        if type(other) is int:
+            return rational._from_coprime(self.numerator + other * self.denominator, self.denominator)
         if isinstance(other, rationalComprehendable):
             other = rational.comprehend(other)
             return rational(numerator=self.numerator * other.denominator + other.numerator * self.denominator, denominator=self.denominator * other.denominator)
@@ -114,6 +134,10 @@ class rational(ExactNumber):
         return self.__add__(other)
     
     def __sub__(self, other):
+        if type(other) is rational:
+            return _add(self.numerator, self.denominator, -other.numerator, other.denominator)
+        if type(other) is int:
+            return rational._from_coprime(self.numerator - other * self.denominator, self.denominator)
         other = simplify(other)
         if isinstance(other, rationalComprehendable):
             other = rational.comprehend(other)
@@ -125,6 +149,8 @@ class rational(ExactNumber):
             raise TypeError(f"unsupported operand type(s) for -: {type(self).__name__} and {type(other).__name__}")
         
     def __rsub__(self, other):
+        if type(other) is int:
+            return rational._from_coprime(other * self.denominator - self.numerator, self.denominator)
         other = simplify(other)
         if isinstance(other, rationalComprehendable):
             other = rational.comprehend(other)
@@ -136,6 +162,10 @@ class rational(ExactNumber):
             raise TypeError(f"unsupported operand type(s) for -: {type(other).__name__} and {type(self).__name__}")
         
     def __mul__(self, other):
+        if type(other) is rational:
+            return _mul(self.numerator, self.denominator, other.numerator, other.denominator)
+        if type(other) is int:
+            return _mul(self.numerator, self.denominator, other, 1)
         other = simplify(other)
         if isinstance(other, rationalComprehendable):
             other = rational.comprehend(other)
@@ -150,6 +180,10 @@ class rational(ExactNumber):
         return self.__mul__(other)
         
     def __truediv__(self, other):
+        if type(other) is rational:
+            return _div(self.numerator, self.denominator, other.numerator, other.denominator)
+        if type(other) is int:
+            return _div(self.numerator, self.denominator, other, 1)
         other = simplify(other)
         if isinstance(other, rationalComprehendable):
             other = rational.comprehend(other)
@@ -161,6 +195,8 @@ class rational(ExactNumber):
             raise TypeError(f"unsupported operand type(s) for /: {type(self).__name__} and {type(other).__name__}")
         
     def __rtruediv__(self, other):
+        if type(other) is int:
+            return _div(other, 1, self.numerator, self.denominator)
         other = simplify(other)
         if isinstance(other, rationalComprehendable):
             other = rational.comprehend(other)
@@ -202,12 +238,13 @@ class rational(ExactNumber):
             raise TypeError(f"unsupported operand type(s) for **: {type(self).__name__} and {type(other).__name__}")
 
     def __neg__(self):
-        return rational(
-            numerator=-self.numerator,
-            denominator=self.denominator
-        )
+        return rational._from_coprime(-self.numerator, self.denominator)
         
     def __eq__(self, other):
+        if type(other) is rational:
+            return self.numerator == other.numerator and self.denominator == other.denominator
+        if type(other) is int:
+            return self.denominator == 1 and self.numerator == other
         other = simplify(other)
         if isinstance(other, rationalComprehendable):
             other = rational.comprehend(other)
@@ -235,41 +272,45 @@ class rational(ExactNumber):
     
     @property
     def is_periodic(self) -> bool:
-        return len(self.to_decimal_parts()[-1]) != 0
+        return _strip_2_5(self.denominator)[0] != 1
+    
+    @property
+    def preperiod_length(self) -> int:
+        "Number of non-repeating decimals"
+        return _strip_2_5(self.denominator)[1]
+    
+    @property
+    def period_length(self) -> int:
+        "Number of repeating decimals, given by the multiplicative order of 10 modulo the denominator without its factors 2 and 5"
+        coprime_part = _strip_2_5(self.denominator)[0]
+        if coprime_part == 1:
+            return 0
+        return _multiplicative_order(10, coprime_part)
+    
+    def decimal_digits(self) -> Iterator[Digit]:
+        "Lazily yields the decimals of the rational (those of `to_decimal_parts`), ending only if the decimal expansion terminates."
+        remainder = self.numerator % self.denominator
+        while remainder != 0:
+            digit, remainder = divmod(remainder * 10, self.denominator)
+            yield digit
     
     def to_decimal_parts(self) -> tuple[int, list[Digit], list[Digit]]:
         "Expresses the rational as a tuple of the whole part, the non-repeating decimals as a list and the repeating decimals as a list."
-        integer_part = self.numerator // self.denominator
-        remainder = abs(self.numerator % self.denominator)
+        integer_part, remainder = divmod(self.numerator, self.denominator)
 
         if remainder == 0:
             return integer_part, [], []
 
-        seen = {}
-        digits = []
-        repeating_start = None
+        preperiod = self.preperiod_length
+        head, remainder = divmod(remainder * 10 ** preperiod, self.denominator)
+        non_repeating = _digits(head, preperiod)
 
-        while remainder != 0:
-            if remainder in seen:
-                repeating_start = seen[remainder]
-                break
-            seen[remainder] = len(digits)
-            remainder *= 10
-            digit = remainder // self.denominator
-            digits.append(digit)
-            remainder %= self.denominator
-
-        if repeating_start is None:
-            non_repeating = digits
-            repeating = []
-        else:
-            non_repeating = digits[:repeating_start]
-            repeating = digits[repeating_start:]
-
-        while non_repeating and non_repeating[-1] == 0 and not repeating:
-            non_repeating.pop()
+        if remainder == 0:
+            return (integer_part, non_repeating, [])
 
-        return (integer_part, non_repeating, repeating)
+        period = self.period_length
+        block = remainder * 10 ** period // self.denominator
+        return (integer_part, non_repeating, _digits(block, period))
     
 def rational_parts_from_float(f: float) -> tuple[int, int]:
     if f == 0.0:
@@ -286,4 +327,71 @@ def rational_parts_from_float(f: float) -> tuple[int, int]:
     g = gcd(numerator, denominator)
     return (numerator // g, denominator // g)
 
+def _digits(n: int, width: int) -> list[Digit]:
+    "Decimal digits of `n`, padded with leading zeros to `width` digits."
+    return [int(d) for d in str(n).zfill(width)] if width else []
+
+def _strip_2_5(n: int) -> tuple[int, int]:
+    "Removes all factors 2 and 5 from `n`, returning the rest and the larger of both multiplicities."
+    twos = (n & -n).bit_length() - 1
+    n >>= twos
+    fives = 0
+    while n % 5 == 0:
+        n //= 5
+        fives += 1
+    return n, max(twos, fives)
+
+def _multiplicative_order(base: int, modulus: int) -> int:
+    "Smallest k > 0 with `base**k % modulus == 1`, for `base` and `modulus` being coprime."
+    order = 1
+    for p, e in factorize(modulus).items():
+        order = lcm(order, (p - 1) * p ** (e - 1))
+    for p in factorize(order):
+        while order % p == 0 and pow(base, order // p, modulus) == 1:
+            order //= p
+    return order
+
+def _hash_fraction(numerator: int, denominator: int) -> int:
+    "Hashes `numerator/denominator` with the same algorithm as the built-in numeric types, so that `hash(rational(n)) == hash(n)`."
+    try:
+        dinv = pow(denominator, -1, hash_info.modulus)
+    except ValueError:
+        h = hash_info.inf
+    else:
+        h = hash(hash(abs(numerator)) * dinv)
+    h = h if numerator >= 0 else -h
+    return -2 if h == -1 else h
+
+def _add(na: int, da: int, nb: int, db: int) -> rational:
+    "Adds `na/da` and `nb/db` (both reduced) while keeping the intermediate products small, just like `fractions.Fraction` does."
+    g = gcd(da, db)
+    if g == 1:
+        return rational._from_coprime(na * db + da * nb, da * db)
+    s = da // g
+    t = na * (db // g) + nb * s
+    g2 = gcd(t, g)
+    if g2 == 1:
+        return rational._from_coprime(t, s * db)
+    return rational._from_coprime(t // g2, s * (db // g2))
+
+def _mul(na: int, da: int, nb: int, db: int) -> rational:
+    "Multiplies `na/da` and `nb/db` (both reduced) by cancelling crosswise before multiplying."
+    g1 = gcd(na, db)
+    if g1 > 1:
+        na //= g1
+        db //= g1
+    g2 = gcd(nb, da)
+    if g2 > 1:
+        nb //= g2
+        da //= g2
+    return rational._from_coprime(na * nb, db * da)
+
+def _div(na: int, da: int, nb: int, db: int) -> rational:
+    "Divides `na/da` by `nb/db` (both reduced)."
+    if nb == 0:
+        raise ValueError("Denominator can't be zero")
+    if nb < 0:
+        nb, db = -nb, -db
+    return _mul(na, da, db, nb)
+
 rationalComprehendable: TypeAlias = int | float | str | rational
\ No newline at end of file
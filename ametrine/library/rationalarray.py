@@ -0,0 +1,184 @@
+from __future__ import annotations
+from typing import Iterable, Iterator
+from decimal import Decimal
+
+import numpy as np
+
+from ametrine.library.rational import rational, rationalComprehendable
+
+_INT64_SAFE = 1 << 31
+"Bound for numerators and denominators stored as int64, so that `a*d + b*c` of two such fractions can't overflow"
+
+
+class RationalArray:
+    """Type, storing a one-dimensional array of rational numbers as two parallel arrays of numerators and denominators.
+
+    Elementwise operations run on whole arrays at once instead of dispatching through `rational.__add__` per element.
+    As long as every numerator and denominator is below 2^31 they are stored as `int64`, otherwise as arrays of Python integers (`object`).
+
+    Supported Magic
+    --------
+    - `+`, `-`, `*`, `/` with another `RationalArray` of the same length or a single `rationalComprehendable`
+    - `==`, `!=`, `<`, `>`, `<=`, `>=` elementwise, returning boolean NumPy arrays
+    - `len()`, indexing, slicing and iteration
+    """
+    __slots__ = ("numerators", "denominators")
+    __hash__ = None
+
+    def __init__(self, values: Iterable[rationalComprehendable] = ()) -> None:
+        values = [rational.comprehend(value) for value in values]
+        self.numerators, self.denominators = _compact(
+            np.array([value.numerator for value in values], dtype=object),
+            np.array([value.denominator for value in values], dtype=object)
+        )
+
+    @classmethod
+    def from_parts(cls, numerators: Iterable[int], denominators: Iterable[int]) -> RationalArray:
+        "Creates an array from parallel sequences of numerators and denominators, which don't need to be reduced."
+        numerators = np.array([int(n) for n in numerators], dtype=object)
+        denominators = np.array([int(d) for d in denominators], dtype=object)
+        if numerators.shape != denominators.shape:
+            raise ValueError("Numerators and denominators need to be of the same length")
+        return cls._from_normalized(*_normalize(numerators, denominators))
+
+    @classmethod
+    def _from_normalized(cls, numerators: np.ndarray, denominators: np.ndarray) -> RationalArray:
+        obj = object.__new__(cls)
+        obj.numerators, obj.denominators = _compact(numerators, denominators)
+        return obj
+
+    def __repr__(self) -> str:
+        return f"RationalArray([{', '.join(str(value) for value in self)}])"
+
+    def __len__(self) -> int:
+        return len(self.numerators)
+
+    def __iter__(self) -> Iterator[rational]:
+        for n, d in zip(self.numerators, self.denominators):
+            yield rational._from_coprime(int(n), int(d))
+
+    def __getitem__(self, index: int | slice) -> rational | RationalArray:
+        if isinstance(index, slice):
+            return RationalArray._from_normalized(self.numerators[index], self.denominators[index])
+        return rational._from_coprime(int(self.numerators[index]), int(self.denominators[index]))
+
+    def to_rationals(self) -> list[rational]:
+        return list(self)
+
+    def to_decimal(self, precision: int) -> np.ndarray:
+        "Returns an array of `Decimal`, each rounded to `precision` decimals (half away from zero)."
+        num, den = self.numerators.astype(object), self.denominators.astype(object)
+        scaled = np.abs(num) * 10 ** precision
+        q, r = scaled // den, scaled % den
+        q = q + (2 * r >= den)
+        to_decimal = np.frompyfunc(lambda n, q: Decimal(f"{'-' if n < 0 else ''}{q}e-{precision}"), 2, 1)
+        return to_decimal(num, q)
+
+    # Arithmetic
+
+    def __add__(self, other):
+        an, ad, bn, bd = _operands(self, other)
+        return RationalArray._from_normalized(*_normalize(an * bd + bn * ad, ad * bd))
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        an, ad, bn, bd = _operands(self, other)
+        return RationalArray._from_normalized(*_normalize(an * bd - bn * ad, ad * bd))
+
+    def __rsub__(self, other):
+        return (-self).__add__(other)
+
+    def __mul__(self, other):
+        an, ad, bn, bd = _operands(self, other)
+        return RationalArray._from_normalized(*_normalize(an * bn, ad * bd))
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        an, ad, bn, bd = _operands(self, other)
+        return RationalArray._from_normalized(*_normalize(an * bd, ad * bn))
+
+    def __rtruediv__(self, other):
+        an, ad, bn, bd = _operands(self, other)
+        return RationalArray._from_normalized(*_normalize(bn * ad, bd * an))
+
+    def __neg__(self):
+        return RationalArray._from_normalized(-self.numerators, self.denominators)
+
+    def __abs__(self):
+        return RationalArray._from_normalized(np.abs(self.numerators), self.denominators)
+
+    # Comparisons
+
+    def __eq__(self, other) -> np.ndarray:
+        an, ad, bn, bd = _operands(self, other)
+        return (an == bn) & (ad == bd)
+
+    def __ne__(self, other) -> np.ndarray:
+        return ~self.__eq__(other)
+
+    def __lt__(self, other) -> np.ndarray:
+        an, ad, bn, bd = _operands(self, other)
+        return an * bd < bn * ad
+
+    def __le__(self, other) -> np.ndarray:
+        an, ad, bn, bd = _operands(self, other)
+        return an * bd <= bn * ad
+
+    def __gt__(self, other) -> np.ndarray:
+        an, ad, bn, bd = _operands(self, other)
+        return an * bd > bn * ad
+
+    def __ge__(self, other) -> np.ndarray:
+        an, ad, bn, bd = _operands(self, other)
+        return an * bd >= bn * ad
+
+    # Reductions
+
+    def sum(self) -> rational:
+        "Returns the exact sum of all elements, computed over the common denominator."
+        if len(self) == 0:
+            return rational(0)
+        num, den = self.numerators.astype(object), self.denominators.astype(object)
+        common = np.lcm.reduce(den)
+        return rational(int((num * (common // den)).sum()), int(common))
+
+    def dot(self, other: RationalArray) -> rational:
+        "Returns the exact dot product with another array of the same length."
+        return (self * other).sum()
+
+
+def _normalize(numerators: np.ndarray, denominators: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    "Reduces every fraction and moves the signs into the numerators."
+    if (denominators == 0).any():
+        raise ValueError("Denominator can't be zero")
+    sign = np.where(denominators < 0, -1, 1)
+    g = np.gcd(numerators, denominators)
+    return sign * numerators // g, sign * denominators // g
+
+def _compact(numerators: np.ndarray, denominators: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    "Stores the arrays as int64 if every value allows it and as Python integers otherwise."
+    fits = len(numerators) == 0 or (np.abs(numerators).max() < _INT64_SAFE and denominators.max() < _INT64_SAFE)
+    dtype = np.int64 if fits else object
+    return numerators.astype(dtype), denominators.astype(dtype)
+
+def _operands(array: RationalArray, other) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    "Brings both operands to arrays (or 0-dimensional arrays for single numbers) of a common dtype."
+    if isinstance(other, RationalArray):
+        if len(other) != len(array):
+            raise ValueError(f"operands could not be broadcast together with lengths {len(array)} and {len(other)}")
+        bn, bd = other.numerators, other.denominators
+    elif isinstance(other, rationalComprehendable):
+        other = rational.comprehend(other)
+        bn, bd = _compact(np.array([other.numerator], dtype=object), np.array([other.denominator], dtype=object))
+        bn, bd = bn[0], bd[0]
+    else:
+        raise TypeError(f"unsupported operand type: {type(other).__name__}")
+
+    an, ad = array.numerators, array.denominators
+    if an.dtype == object or np.asarray(bn).dtype == object:
+        return an.astype(object), ad.astype(object), np.asarray(bn, dtype=object), np.asarray(bd, dtype=object)
+    return an, ad, bn, bd
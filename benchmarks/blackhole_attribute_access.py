@@ -0,0 +1,53 @@
+"""
+Micro-benchmark for attribute access on `BlackHole`.
+
+Compares the class with the `__getattribute__` override it used before
+(every access wrapped in try/except, with a regex search on errors to report
+formulas a metric doesn't have) with the current class, which checks the
+metric's formulas only when a property dispatches to one.
+
+Run from the repository root with `python -m benchmarks.blackhole_attribute_access`.
+"""
+
+import re as regex
+from timeit import timeit
+
+from blackholepy.blackhole import BlackHole
+
+
+class OverriddenBlackHole(BlackHole):
+    def __getattribute__(self, name):
+        try:
+            value = super().__getattribute__(name)
+
+        except Exception as e:
+            msg = str(e)
+            if match := regex.search(r"cannot sympify object of type <class 'ellipsis'>", msg):
+                raise NotImplementedError(f"Calculation of '{name}' has not yet been implemented for {self.metric} black holes.")
+            raise e
+
+        return value
+
+
+def recompute(bh: BlackHole) -> None:
+    "Invalidates the cached properties and recalculates one, which reads many attributes on the way"
+    bh.mass = bh.mass
+    bh.temperature
+
+def bench(label: str, access, before: BlackHole, after: BlackHole, repeat: int) -> None:
+    t_before = timeit(lambda: access(before), number=repeat) / repeat
+    t_after = timeit(lambda: access(after), number=repeat) / repeat
+    print(f"{label:<28} before {t_before * 1e9:9.1f}ns   after {t_after * 1e9:9.1f}ns   speedup {t_before / t_after:5.2f}x")
+
+
+if __name__ == "__main__":
+    before = OverriddenBlackHole(10**30, 10**2, 10**9)
+    after = BlackHole(10**30, 10**2, 10**9)
+    for bh in (before, after):
+        recompute(bh)
+
+    bench("field (mass)", lambda bh: bh.mass, before, after, 1_000_000)
+    bench("field (metric)", lambda bh: bh.metric, before, after, 1_000_000)
+    bench("property (spins)", lambda bh: bh.spins, before, after, 500_000)
+    bench("cached property", lambda bh: bh.temperature, before, after, 500_000)
+    bench("recomputed property", recompute, before, after, 2_000)
@@ -0,0 +1,52 @@
+"""
+Micro-benchmark for the `rational` arithmetic fast path.
+
+Compares the current operators with the generic pipeline they used before
+(`simplify()` → `rational.comprehend()` → `rational(...)` with a full gcd).
+
+Run from the repository root with `python -m benchmarks.rational_arithmetic`.
+"""
+
+from random import Random
+from timeit import timeit
+
+from ametrine.ausgelagert import simplify
+from ametrine.library.rational import rational
+
+
+def generic_add(x: rational, y) -> rational:
+    y = rational.comprehend(simplify(y))
+    return rational(x.numerator * y.denominator + y.numerator * x.denominator, x.denominator * y.denominator)
+
+def generic_mul(x: rational, y) -> rational:
+    y = rational.comprehend(simplify(y))
+    return rational(x.numerator * y.numerator, x.denominator * y.denominator)
+
+def generic_truediv(x: rational, y) -> rational:
+    y = rational.comprehend(simplify(y))
+    return rational(x.numerator * y.denominator, x.denominator * y.numerator)
+
+
+def operands(count: int, bits: int, seed: int = 0) -> list[rational]:
+    rng = Random(seed)
+    return [rational(rng.getrandbits(bits) - (1 << (bits - 1)), rng.getrandbits(bits) | 1) for _ in range(count)]
+
+def bench(label: str, fast, generic, pairs, repeat: int) -> None:
+    t_generic = timeit(lambda: [generic(x, y) for x, y in pairs], number=repeat)
+    t_fast = timeit(lambda: [fast(x, y) for x, y in pairs], number=repeat)
+    print(f"{label:<28} generic {t_generic:8.4f}s   fast {t_fast:8.4f}s   speedup {t_generic / t_fast:5.2f}x")
+
+
+if __name__ == "__main__":
+    for bits in (16, 256):
+        xs = operands(2000, bits, seed=1)
+        ys = operands(2000, bits, seed=2)
+        pairs = list(zip(xs, ys))
+        int_pairs = [(x, int(y.numerator)) for x, y in pairs]
+
+        print(f"--- {bits}-bit numerators/denominators ---")
+        bench("rational + rational", lambda x, y: x + y, generic_add, pairs, 20)
+        bench("rational * rational", lambda x, y: x * y, generic_mul, pairs, 20)
+        bench("rational / rational", lambda x, y: x / y, generic_truediv, pairs, 20)
+        bench("rational + int", lambda x, y: x + y, generic_add, int_pairs, 20)
+        bench("rational * int", lambda x, y: x * y, generic_mul, int_pairs, 20)
@@ -5,12 +5,29 @@
 #
 #
 
-from blackholepy.blackhole import BlackHole
+# Submodule werden erst beim ersten Zugriff geladen, da SymPy und die Formeln der Metriken Sekunden zum Laden brauchen
+_lazy = {
+    "BlackHole":           "blackholepy.blackhole",
+    "BlackHolePopulation": "blackholepy.population",
+    "evolve":              "blackholepy.evolution",
+    "quantity":            "blackholepy.precompiled",
+    "sweep":               "blackholepy.sweep",
+    "Ensemble":            "blackholepy.ensemble",
+    "Scenario":            "blackholepy.ensemble"
+}
 
-_symbols = [BlackHole]
-_constants = []
+__all__ = list(_lazy)
 
-__all__ = [obj.__name__ for obj in _symbols].extend(_constants)
+def __getattr__(name: str):
+    if name in _lazy:
+        from importlib import import_module
+        value = getattr(import_module(_lazy[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module 'blackholepy' has no attribute '{name}'")
+
+def __dir__():
+    return sorted([*globals(), *_lazy])
 
 # ╭───────────────────────────────────────────────────────────────────────────────╮
 # │                                     Config                                    │ 
@@ -0,0 +1,107 @@
+from contextlib import nullcontext
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, ContextManager, Literal
+
+import mpmath
+import sympy
+from sympy import Equality, Expr, Rational, Symbol, lambdify, solve
+from sympy.printing.pycode import SymPyPrinter
+
+import blackholepy.config as config
+
+BackendName = Literal["symbolic", "float64", "mpmath"]
+
+@lru_cache(maxsize=None)
+def solved(eq: Equality, unknown: Symbol) -> tuple[Expr, ...]:
+    "All solutions of `eq` for `unknown`. Each equation is only solved once per unknown."
+    return tuple(solve(eq, unknown))
+
+class _ExactPrinter(SymPyPrinter):
+    "Prints rational constants and pi as SymPy objects instead of Python floats, so compiled formulas stay exact"
+
+    def _print_Rational(self, expr):
+        return f"sympy.Rational({expr.p}, {expr.q})"
+
+    def _print_Pi(self, expr):
+        return "sympy.pi"
+
+@lru_cache(maxsize=None)
+def compiled(eq: Equality, unknown: Symbol, module: Literal["sympy", "numpy", "mpmath"] = "sympy", solution: int = 0) -> tuple[tuple[Symbol, ...], Callable[..., Any]]:
+    """A solution of `eq` for `unknown`, compiled with `lambdify` to a function of its free symbols.<br>
+    Returns the symbols in the order the function takes them, together with the function.
+    """
+    formula = solved(eq, unknown)[solution]
+    args = tuple(sorted(formula.free_symbols, key=str))
+    return args, lambdified(args, formula, module)
+
+def lambdified(args: tuple[Symbol, ...], expr: Expr, module: Literal["sympy", "numpy", "math", "mpmath"], cse: bool = False) -> Callable[..., Any]:
+    """Compiles `expr` to a function of `args`.<br>
+    With `module="sympy"` the function computes with SymPy numbers, so exact inputs give the same exact results as substituting them.
+    With `module="numpy"` it computes elementwise in float64 and accepts arrays, with `module="math"` the same for single floats,
+    and with `module="mpmath"` it computes at the current `mpmath` precision.
+    """
+    if module == "sympy":
+        return lambdify(args, expr, modules=[{"sympy": sympy}, "sympy"], printer=_ExactPrinter, cse=cse)
+    if module in ("numpy", "math"):
+        # Konstanten als Floats, sonst landen Ganzzahlen jenseits von int64 als Objekt-Arrays in NumPy
+        return lambdify(args, expr.evalf(17), modules=module, cse=cse)
+    return lambdify(args, expr, modules=module, cse=cse)
+
+@dataclass(frozen=True)
+class Backend():
+    """Number type to calculate with, see `config.backend`.
+
+    The backend converts the parameters of a black hole into its numbers and evaluates compiled formulas with them.
+    """
+    name:    BackendName
+    module:  Literal["sympy", "numpy", "mpmath"]
+    "Module the formulas are compiled with, see `compiled`"
+    convert: Callable[[Any], Any]
+
+    def __repr__(self):
+        return f"<Backend '{self.name}'>"
+
+    @property
+    def exact(self) -> bool:
+        return self.name == "symbolic"
+
+    def context(self) -> ContextManager:
+        "Context to evaluate formulas in"
+        if self.name == "mpmath":
+            return mpmath.workdps(config.mpmath_digits)
+        return nullcontext()
+
+    def number(self, value) -> Any:
+        "Converts a number (int, float, str, SymPy or mpmath number) into a number of this backend"
+        with self.context():
+            return self.convert(value)
+
+    def evaluate(self, eq: Equality, unknown: Symbol, values: dict[Symbol, Any], solution: int = 0) -> Any:
+        "Evaluates a solution of `eq` for `unknown`, all of its symbols have to be in `values`"
+        return self.apply(*compiled(eq, unknown, self.module, solution), values)
+
+    def apply(self, args: tuple[Symbol, ...], function: Callable[..., Any], values: dict[Symbol, Any]) -> Any:
+        "Calls a function compiled for this backend's module with the `values` of its `args`"
+        with self.context():
+            return function(*(self.convert(values[symbol]) for symbol in args))
+
+def _to_mpf(value) -> mpmath.mpf:
+    if isinstance(value, sympy.Basic):
+        value = value.evalf(config.mpmath_digits + 5)
+    return mpmath.mpmathify(value)
+
+def _to_rational(value) -> Expr:
+    return value if isinstance(value, sympy.Basic) else Rational(value)
+
+backends: dict[BackendName, Backend] = {
+    "symbolic": Backend("symbolic", "sympy", _to_rational),
+    "float64":  Backend("float64", "numpy", float),
+    "mpmath":   Backend("mpmath", "mpmath", _to_mpf)
+}
+
+def current() -> Backend:
+    "The backend selected by `config.backend`"
+    if config.backend not in backends:
+        raise ValueError(f"Unknown backend '{config.backend}', choose one of {', '.join(backends)}")
+    return backends[config.backend]
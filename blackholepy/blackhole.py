@@ -1,11 +1,14 @@
 from dataclasses import dataclass, field
+from functools import wraps
 import warnings
-import re as regex
 
-from sympy import sqrt, Equality, solve, Expr, Rational, N
+from sympy import Equality, Expr, Rational, N
 
 from blackholepy import config
 from blackholepy import formulas
+from blackholepy import backends
+from blackholepy.backends import Backend
+from blackholepy.graph import Formula, metric_graph
 from blackholepy.formulas import calculate, BlackHoleMetric, KerrMetric, KerrNewmanMetric, SchwarzschildMetric, ReissnerNordströmMetric, approx
 from blackholepy.symbols import *
 from blackholepy.exceptions import *
@@ -14,6 +17,25 @@ def spin_param(spin: float, mass: float) -> float:
     "Calculate a black holes spin from its spin parameter"
     return calculate(formulas.dimensionless_spin, {a_star: spin, M: mass}, a)
 
+_STATE: tuple[str, ...] = ("mass", "spin", "charge", "metric")
+"Attributes every other property of a black hole is derived from"
+
+_STATE_SYMBOLS: dict[Symbol, str] = {M: "mass", a: "spin", Q: "charge"}
+
+def _cached(*state: str):
+    """Turns a method into a property whose value is cached per instance.<br>
+    The cached value is dropped as soon as any of the state it depends on changes. Dependencies are recorded while computing:
+    the metric, the state named here, the mass, spin and charge used by `_calc_property` and the dependencies of every cached property read in the process.
+    """
+    def decorator(method):
+        name = method.__name__
+
+        @wraps(method)
+        def getter(self):
+            return self._cached_value(name, method, state)
+        return property(getter)
+    return decorator
+
 @dataclass
 class BlackHole():
     """Class representing a black hole.
@@ -26,6 +48,9 @@ class BlackHole():
         Not to be confused with the spin parameter *a*<sub>*</sub> (between 0 and 1) or the angular momentum *J* (in kg·m²/s).
     charge : coloumb as float
 
+    The parameters are converted into numbers of the backend selected by `config.backend` at creation,
+    which every property of the black hole is calculated with.
+
     Raises
     ----------
     CosmicCensorshipHypothesis : If parameters exceed certain limits, so that event horizons become imaginary
@@ -38,11 +63,16 @@ class BlackHole():
     metric: BlackHoleMetric = field(init=False)
     "Collection of formulas that descripe the black holes properties"
     fix_metric: bool        = field(init=False, default=False)
+    backend: Backend        = field(init=False, repr=False, compare=False)
+    _cache: dict[str, tuple[object, frozenset[str]]] = field(init=False, default_factory=dict, repr=False, compare=False)
+    _computing: list[set[str]]                      = field(init=False, default_factory=list, repr=False, compare=False)
 
     def __post_init__(self):
-        self.mass   = Rational(self.mass)
-        self.spin   = Rational(self.spin)
-        self.charge = Rational(self.charge)
+        self.backend = backends.current()
+        self.mass   = self.backend.number(self.mass)
+        self.spin   = self.backend.number(self.spin)
+        self.charge = self.backend.number(self.charge)
+        self._evaluate_metric()
 
         if self.mass < 0:
             raise LawOfConservationOfEnergy(f"Negative mass contradicts the general theory of relativity.")
@@ -53,10 +83,45 @@ class BlackHole():
         if abs(self.charge) > approx(self._max_allowed_charge):
             raise CosmicCensorshipHypothesis(f"The amount of charge stated exceeds '{self._max_allowed_charge}' (coloumb) and therefore violates the cosmic censorship hypothesis.")
 
-        self._evaluate_metric()
-
     def __repr__(self):
         return f"BlackHole(M={N(self.mass, config.float_precision)}, a={N(self.spin, config.float_precision)}, Q={N(self.charge, config.float_precision)})"
+
+    def __setattr__(self, name, value):
+        if name in _STATE:
+            if name == "metric" and self.__dict__.get("metric") is value:
+                return
+            self._invalidate(name)
+        super().__setattr__(name, value)
+
+    def _invalidate(self, state: str) -> None:
+        "Drops every cached value that depends on `state`"
+        cache = self.__dict__.get("_cache")
+        if cache:
+            for name in [name for name, (_, dependencies) in cache.items() if state in dependencies]:
+                del cache[name]
+
+    def _depends_on(self, state: set[str] | frozenset[str]) -> None:
+        "Records dependencies for the cached property that is currently being computed"
+        if self._computing:
+            self._computing[-1].update(state)
+
+    def _cached_value(self, name: str, method, state: tuple[str, ...]):
+        if name in self._cache:
+            value, dependencies = self._cache[name]
+            self._depends_on(dependencies)
+            return value
+
+        computation = {"metric", *state}
+        self._computing.append(computation)
+        try:
+            value = method(self)
+        finally:
+            self._computing.pop()
+
+        dependencies = frozenset(computation)
+        self._cache[name] = (value, dependencies)
+        self._depends_on(dependencies)
+        return value
     
     def _evaluate_metric(self) -> None:
         if not self.fix_metric:
@@ -70,56 +135,45 @@ class BlackHole():
                 self.metric = KerrNewmanMetric
 
     def _calc_property(self, eq: Equality, unknown: Symbol, overwrite: dict[Symbol, Rational] = {}) -> Expr:
-        "unknown will not be substitued with a known value"
-
-        getters = {
-            r_minus: lambda: self.innerHorizon,
-            r_plus:  lambda: self.outerHorizon,
-            R:       lambda: self.radius,
-            M:       lambda: self.mass,
-            M_irr:   lambda: self.irreducible_mass, 
-            a:       lambda: self.spin,
-            Q:       lambda: self.charge,
-            A:       lambda: self.horizon_area,
-            κ:       lambda: self.surface_gravity
-        }
-
-        getters.update({k: (lambda v=v: v) for k, v in overwrite.items()})
-
-        solved = solve(eq, unknown)
-        if not solved:
-            raise FaultyImplementation(f"Cannot solve equation for {unknown}: {eq}")
-
-        needed_symbols = solved[0].free_symbols
-
-        values = {}
-        for symbol, getter in getters.items():
-            if symbol in needed_symbols and symbol != unknown:
-                try:
-                    values[symbol] = getter()
-                except RecursionError:
-                    values[symbol] = None
+        """Calculates `unknown` by `eq`, whose inputs are derived from mass, spin and charge (and the quantities in `overwrite`)
+        by the formula graph of the black hole's metric.
+        """
+        known = {M: self.mass, a: self.spin, Q: self.charge, **overwrite}
+        args, function = metric_graph(self.metric).compile(Formula(eq, unknown), known, self.backend.module)
 
-        return calculate(eq=eq, values=values, unknown=unknown, mode="single")
+        self._depends_on({_STATE_SYMBOLS[symbol] for symbol in args if symbol in _STATE_SYMBOLS and symbol not in overwrite})
+        return self.backend.apply(args, function, known)
 
 
-    def advance_time(self, seconds: Rational, /, warn_on_evaporation: bool = True) -> None:
+    def advance_time(self, seconds: Rational, /, warn_on_evaporation: bool = True, numeric: bool = False) -> None:
         """Reevaluates the properties of the black hole as if `timespan` time had passed.<br>
-        This will reduce it's mass due to hawking radiation.
+        This will reduce it's mass due to hawking radiation, and spin and charge in proportion to it.<br>
+        With `numeric=True` the mass loss is integrated in float64 (see `blackholepy.evolution`) instead of being derived from the evaporation time.
         """
-        seconds = Rational(seconds)
+        if numeric:
+            from blackholepy.evolution import evolve
+            from blackholepy.population import BlackHolePopulation
+
+            final = evolve(BlackHolePopulation.from_black_holes([self]), [float(seconds)], warn_on_evaporation=warn_on_evaporation).final
+            self.mass, self.spin, self.charge = (self.backend.number(float(value[0])) for value in (final.mass, final.spin, final.charge))
+            return
+
+        seconds = self.backend.number(seconds)
+        evaporation_time = self.evaporation_time
 
         # Hawking Radiation
-        if seconds > self.evaporation_time:
+        if seconds > evaporation_time:
             target_time = 0
             if warn_on_evaporation:
-                warnings.warn(f"The black hole evaporated in the process of advancing {seconds} seconds (after ~{(100 * self.evaporation_time / seconds):.4f}% of the time).")
+                warnings.warn(f"The black hole evaporated in the process of advancing {seconds} seconds (after ~{(100 * evaporation_time / seconds):.4f}% of the time).")
         else:
-            target_time = self.evaporation_time - seconds
+            target_time = evaporation_time - seconds
 
-        self.mass = self._calc_property(self.metric.evaporation_time, M, {τ: target_time})
-
-        # Calculations for spin and charge missing
+        # τ ∝ M³ bei konstantem a* und q* (siehe `formulas`), Spin und Ladung schrumpfen also mit der Masse
+        with self.backend.context():
+            scale = (target_time / evaporation_time) ** self.backend.number(Rational(1, 3)) if target_time else 0
+            self.mass, self.spin, self.charge = (self.backend.number(value * scale) for value in (self.mass, self.spin, self.charge))
+        self._evaluate_metric()
 
     def penrose_process(self, delta_J: Rational, /, warn_on_metric_change: bool = True) -> None:
         """Applies a Penrose-like rotational energy extraction by reducing the spin angular momentum *J*.
@@ -127,20 +181,21 @@ class BlackHole():
 
         J_initial = self.angular_momentum
 
-        J_final = J_initial - Rational(delta_J)
+        delta_J = self.backend.number(delta_J)
+        J_final = J_initial - delta_J
         if J_final < 0:
             J_final = 0.0
             if warn_on_metric_change:
-                warnings.warn(f"The black holes angular momentum is just {J_initial.n(config.float_precision)} kg·m²/s (≳ {((100 * Rational(delta_J) / J_initial) - 100):.2f}% too much to extract). The remaining penrose process is discarded and the black hole was reduced to the Schwarzschild metric.")
+                warnings.warn(f"The black holes angular momentum is just {N(J_initial, config.float_precision)} kg·m²/s (≳ {((100 * delta_J / J_initial) - 100):.2f}% too much to extract). The remaining penrose process is discarded and the black hole was reduced to the Schwarzschild metric.")
 
         self.spin = self._calc_property(formulas.spin_momentum, a, overwrite={J: J_final})
-        self.mass = self._calc_property(Equality(M, sqrt(M_irr**2 + (J_final**2 * c**2) / (4 * G**2 * M_irr**2))), M)
+        self.mass = self._calc_property(formulas.christodoulou_mass, M, overwrite={J: J_final})
         self._evaluate_metric()
 
 
     def feed(self, mass: float, /) -> None:
         """Increases the black holes mass the given amount."""
-        self.mass += mass
+        self.mass += self.backend.number(mass)
     
     @property
     def spins(self) -> bool:
@@ -152,30 +207,30 @@ class BlackHole():
         "Whether the black hole has charge"
         return not self.charge == 0
     
-    @property
+    @_cached()
     def _max_allowed_spin(self) -> Expr:
-        return self._calc_property(Equality(a, (G * M) / c**2), a)
+        return self._calc_property(formulas.max_spin, a)
     
-    @property
+    @_cached()
     def _max_allowed_charge(self) -> Expr:
-        return self._calc_property(Equality(Q, sqrt(4 * π * ε_0 * G) * M), Q)
+        return self._calc_property(formulas.max_charge, Q)
     
-    @property
+    @_cached()
     def angular_momentum(self) -> Expr:
         "Angular momentum of the black hole"
         return self._calc_property(formulas.spin_momentum, J)
     
-    @property
+    @_cached()
     def dimless_spin(self) -> Expr:
         ""
         return self._calc_property(formulas.dimensionless_spin, a_star)
     
-    @property
+    @_cached()
     def horizons(self) -> tuple[Expr, Expr | None]:
 
         return (
-            self._calc_property(self.metric.r_plus, r_plus),
-            self._calc_property(self.metric.r_minus, r_minus) if self.metric.r_minus is not None else None
+            self._calc_property(self.metric.formula("r_plus"), r_plus),
+            self._calc_property(self.metric.formula("r_minus"), r_minus) if self.metric.r_minus is not None else None
         )
     
     @property
@@ -193,72 +248,55 @@ class BlackHole():
         "Radius of the black hole given by the outermost event horizon"
         return self.outerHorizon
     
-    @property
+    @_cached()
     def horizon_area(self) -> Expr:
         """
         Area of the black hole's outermost event horizon<br>
         This area can be larger than the surface area of a sphere with the black hole's radius.
         """
-        return self._calc_property(self.metric.horizon_area, A)
+        return self._calc_property(self.metric.formula("horizon_area"), A)
 
-    @property
+    @_cached()
     def volume(self) -> Expr:
         """Volume of the black hole<br>
         This volume can be larger than the volume of a sphere with the black hole's radius.
         """
         if not self.metric == SchwarzschildMetric:
             warnings.warn("Volume calculation for black holes that aren't of the Schwarzschild metric is only approximated.")
-        return self._calc_property(Equality(V, R**3 * π * 4/3), V)
+        return self._calc_property(formulas.volume, V)
 
-    @property
+    @_cached()
     def density(self) -> Expr:
         "Density of the black hole"
-        return self._calc_property(Equality(ρ, M / V), ρ, {V: self.volume})
+        return self._calc_property(formulas.density, ρ, {V: self.volume})
     
-    @property
+    @_cached()
     def surface_gravity(self) -> Expr:
         "Surface gravity of the black hole"
-        return self._calc_property(self.metric.surface_gravity, κ)
+        return self._calc_property(self.metric.formula("surface_gravity"), κ)
     
-    @property
+    @_cached()
     def temperature(self) -> Expr:
         "Hawking temperature of the black hole"
-        return self._calc_property(self.metric.hawking_temperature, T_H)
+        return self._calc_property(self.metric.formula("hawking_temperature"), T_H)
     
-    @property
+    @_cached()
     def irreducible_mass(self) -> Expr:
         "Gravitational mass of the black hole that isn't a side effect of spin or charge"
         # raise FaultyImplementation("Can't be calculated because float precision")
         return self._calc_property(formulas.irreducable_mass, M_irr)
     
-    @property
+    @_cached("mass")
     def reducable_mass(self) -> Expr:
         "Gravitational mass of the black hole that is a side effect of spin or charge and thus can be extracted by a Penrose process or magnetic extraction"
         return self.mass - self.irreducible_mass
     
-    @property
+    @_cached()
     def hawking_power(self) -> Expr:
         "Power of the black hole's Hawking radiation"
-        return self._calc_property(self.metric.hawking_power, P)
+        return self._calc_property(self.metric.formula("hawking_power"), P)
     
-    @property
+    @_cached()
     def evaporation_time(self) -> Expr:
         "Amount of time until the black hole will have completely evaporated"
-        return self._calc_property(self.metric.evaporation_time, τ)
-
-    def __getattribute__(self, name):
-        try:
-            value = super().__getattribute__(name)
-
-        except Exception as e:
-            msg = str(e)
-            if match := regex.search(r"cannot sympify object of type <class 'ellipsis'>", msg):
-                raise NotImplementedError(
-                    f"Calculation of '{name}' has not yet been implemented for {self.metric} black holes.\n" + 
-                    f"It is not definitely stated, but this is most certainly the case, because the dependencies of the parameters are non-trivial "
-                    f"and thus, a calculation process would be very complex."
-                )
-            raise e
-        
-        return value
-        
\ No newline at end of file
+        return self._calc_property(self.metric.formula("evaporation_time"), τ)
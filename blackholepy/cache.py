@@ -0,0 +1,65 @@
+"""Optional on-disk cache of compiled formulas, enabled by setting `config.formula_cache` to a directory.
+
+Compiled functions are stored as marshalled code objects together with the names of their arguments.
+Entries are keyed by a hash of the formulas' source files, the Python version and the query,
+so that changed formulas never load stale functions. Loading an entry doesn't need SymPy.
+"""
+from functools import lru_cache
+from hashlib import sha256
+from importlib import import_module
+from pathlib import Path
+from types import FunctionType
+from typing import Any, Callable
+import marshal
+import os
+import sys
+
+import blackholepy.config as config
+
+_SOURCES = ("symbols.py", "formulas.py", "backends.py", "graph.py")
+"Files defining the formulas and how they are compiled"
+
+@lru_cache(maxsize=None)
+def _version() -> bytes:
+    digest = sha256(sys.version.encode())
+    for name in _SOURCES:
+        digest.update((Path(__file__).parent / name).read_bytes())
+    return digest.digest()
+
+def enabled() -> bool:
+    return bool(config.formula_cache)
+
+def key(*parts: str) -> str:
+    "Hash identifying a compiled formula by the given parts of its query"
+    return sha256(_version() + "\0".join(parts).encode()).hexdigest()
+
+def _path(key: str) -> Path | None:
+    if not enabled():
+        return None
+    return Path(config.formula_cache).expanduser() / f"{key}.marshal"
+
+def _namespace(module: str) -> dict[str, Any]:
+    # lambdify-Funktionen greifen je nach Drucker auf `modul.name` oder direkt auf `name` zu
+    imported = import_module(module)
+    return {**vars(imported), module: imported}
+
+def load(key: str, module: str) -> tuple[tuple[str, ...], Callable[..., Any]] | None:
+    "The names of the arguments and the function stored under `key`, None if there is no such entry"
+    path = _path(key)
+    if path is None or not path.is_file():
+        return None
+    try:
+        args, code = marshal.loads(path.read_bytes())
+    except (EOFError, ValueError, TypeError):
+        return None
+    return tuple(args), FunctionType(code, _namespace(module))
+
+def store(key: str, args: tuple[str, ...], function: Callable[..., Any]) -> None:
+    "Stores a function compiled by `lambdify` under `key`, if the cache is enabled"
+    path = _path(key)
+    if path is None:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_suffix(f".{os.getpid()}.tmp")
+    temporary.write_bytes(marshal.dumps((tuple(args), function.__code__)))
+    os.replace(temporary, path)
@@ -1,3 +1,16 @@
+from typing import Literal
+import os
+
 float_precision: int = 11
 """
-"""
\ No newline at end of file
+"""
+backend: Literal["symbolic", "float64", "mpmath"] = "symbolic"
+"""Number type new black holes calculate with<br>
+`"symbolic"` keeps exact SymPy expressions, `"float64"` uses NumPy floats and `"mpmath"` uses mpmath floats with `mpmath_digits` digits.
+"""
+mpmath_digits: int = 50
+"Significant digits of the `mpmath` backend"
+formula_cache: str | None = os.environ.get("BLACKHOLEPY_CACHE")
+"Directory of the on-disk cache of compiled formulas (see `blackholepy.cache`), disabled if None"
+check_dimensions: bool = bool(os.environ.get("BLACKHOLEPY_CHECK_DIMENSIONS"))
+"Whether to check the dimensions of all formulas when loading them, warning about inconsistent ones"
\ No newline at end of file
@@ -0,0 +1,131 @@
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Iterable, Iterator
+import os
+import re as regex
+import warnings
+
+import blackholepy.config as config
+
+OPERATIONS: tuple[str, ...] = ("feed", "penrose_process", "advance_time")
+"Methods of `BlackHole` a scenario can consist of"
+
+_CONFIG: tuple[str, ...] = ("float_precision", "backend", "mpmath_digits", "formula_cache")
+"Settings handed to the worker processes, which don't necessarily inherit them"
+
+@dataclass(frozen=True)
+class Scenario():
+    """Initial parameters of a black hole and a sequence of operations applied to it.
+
+    Every operation is a tuple of the name of a `BlackHole` method out of `OPERATIONS` and its argument,
+    optionally followed by a dict of keyword arguments, e.g. `("advance_time", 10**20, {"numeric": True})`.
+    """
+    mass:       Any
+    spin:       Any = 0
+    charge:     Any = 0
+    operations: tuple[tuple, ...] = ()
+
+    def __post_init__(self):
+        object.__setattr__(self, "operations", tuple(tuple(operation) for operation in self.operations))
+        for operation in self.operations:
+            if not 2 <= len(operation) <= 3 or operation[0] not in OPERATIONS:
+                raise ValueError(f"Operations have to be (name, argument[, keyword arguments]) with a name out of {', '.join(OPERATIONS)}, not {operation}")
+
+@dataclass(frozen=True)
+class ScenarioResult():
+    "Final parameters of the black hole of a scenario"
+    index:         int
+    "Position of the scenario in the ensemble"
+    mass:          Any
+    spin:          Any
+    charge:        Any
+    warnings:      tuple[str, ...] = ()
+    "Messages of the warnings emitted while running the scenario"
+    warning_kinds: tuple[str, ...] = ()
+    "Category and message template (numbers replaced by `#`) of each warning, by which `Ensemble.warnings` counts them"
+    error:         str | None = None
+    "Message of the exception that stopped the scenario, in which case the parameters are those before the failed operation"
+
+def run_scenario(index: int, scenario: Scenario) -> ScenarioResult:
+    "Runs a single scenario, recording its warnings instead of printing them"
+    from blackholepy.blackhole import BlackHole
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        black_hole, error = None, None
+        try:
+            black_hole = BlackHole(scenario.mass, scenario.spin, scenario.charge)
+            for name, argument, *options in scenario.operations:
+                getattr(black_hole, name)(argument, **(options[0] if options else {}))
+        except Exception as e:
+            # ein fehlschlagendes Szenario soll das restliche Ensemble nicht abbrechen
+            error = f"{type(e).__name__}: {e}"
+
+    state = (black_hole.mass, black_hole.spin, black_hole.charge) if black_hole is not None else (scenario.mass, scenario.spin, scenario.charge)
+    return ScenarioResult(
+        index, *state,
+        warnings      = tuple(str(warning.message) for warning in caught),
+        warning_kinds = tuple(f"{warning.category.__name__}: {_template(str(warning.message))}" for warning in caught),
+        error         = error
+    )
+
+_NUMBER = regex.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+def _template(message: str) -> str:
+    "The message with its numbers replaced by `#`, so that the same warning of different black holes is counted together"
+    return _NUMBER.sub("#", message)
+
+def _run_chunk(chunk: list[tuple[int, Scenario]], settings: dict[str, Any]) -> list[ScenarioResult]:
+    for name, value in settings.items():
+        setattr(config, name, value)
+    return [run_scenario(index, scenario) for index, scenario in chunk]
+
+@dataclass
+class Ensemble():
+    """Runs many independent scenarios in a process pool.
+
+    Scenarios are scheduled in chunks of `chunksize`, with at most two chunks per process in flight,
+    so an ensemble can be a lazy iterable of any length. Results are yielded as soon as their chunk completes,
+    which isn't necessarily in the order of the scenarios (see `ScenarioResult.index`).<br>
+    Warnings are recorded per result and counted in `warnings` instead of being printed.
+    A scenario raising any exception records it in its result, the others keep running.
+    """
+    processes: int | None = None
+    "Number of worker processes, all CPUs if None; with 0 scenarios are run in this process"
+    chunksize: int        = 16
+    warnings:  Counter[str] = field(default_factory=Counter)
+    "How often each kind of warning was emitted over all runs, by category and message template (see `ScenarioResult.warning_kinds`)"
+
+    def run(self, scenarios: Iterable[Scenario]) -> Iterator[ScenarioResult]:
+        chunks = _chunked(enumerate(scenarios), self.chunksize)
+        settings = {name: getattr(config, name) for name in _CONFIG}
+
+        if self.processes == 0:
+            for chunk in chunks:
+                yield from self._record(_run_chunk(chunk, settings))
+            return
+
+        processes = self.processes or os.cpu_count() or 1
+        with ProcessPoolExecutor(processes) as executor:
+            pending = set()
+            for chunk in islice(chunks, 2 * processes):
+                pending.add(executor.submit(_run_chunk, chunk, settings))
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from self._record(future.result())
+                    for chunk in islice(chunks, 1):
+                        pending.add(executor.submit(_run_chunk, chunk, settings))
+
+    def _record(self, results: list[ScenarioResult]) -> Iterator[ScenarioResult]:
+        for result in results:
+            self.warnings.update(result.warning_kinds)
+            yield result
+
+def _chunked(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
@@ -0,0 +1,177 @@
+from dataclasses import dataclass
+from typing import Callable
+import warnings
+
+import numpy as np
+
+from blackholepy.population import BlackHolePopulation
+from blackholepy.symbols import constants, c
+
+Rates = Callable[[np.ndarray, np.ndarray, np.ndarray], tuple[np.ndarray, np.ndarray, np.ndarray]]
+"Function of (mass, spin, charge) arrays returning their rates of change per second"
+
+_C = float(constants[c])
+
+# Dormand-Prince 5(4)
+_A = (
+    (),
+    (1/5,),
+    (3/40, 9/40),
+    (44/45, -56/15, 32/9),
+    (19372/6561, -25360/2187, 64448/6561, -212/729),
+    (9017/3168, -355/33, 46732/5247, 49/176, -5103/18656),
+    (35/384, 0, 500/1113, 125/192, -2187/6784, 11/84)
+)
+_B = np.array([35/384, 0, 500/1113, 125/192, -2187/6784, 11/84, 0])
+_B_ERROR = _B - np.array([5179/57600, 0, 7571/16695, 393/640, -92097/339200, 187/2100, 1/40])
+
+_SAFETY = 0.9
+_MIN_FACTOR, _MAX_FACTOR = 0.2, 5.0
+
+@dataclass
+class Evolution():
+    """Time series of a population, recorded by `evolve`.
+
+    `mass`, `spin` and `charge` have one row per entry of `times` and one column per black hole.
+    """
+    times:      np.ndarray
+    mass:       np.ndarray
+    spin:       np.ndarray
+    charge:     np.ndarray
+    evaporated: np.ndarray
+    "Whether each black hole has completely evaporated by the last time"
+    steps:      int
+    "Number of (vectorized) Runge-Kutta steps taken"
+
+    @property
+    def final(self) -> BlackHolePopulation:
+        "The population at the last recorded time"
+        return BlackHolePopulation._unchecked(self.mass[-1], self.spin[-1], self.charge[-1])
+
+def hawking_rates(mass: np.ndarray, spin: np.ndarray, charge: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Loss of mass by Hawking radiation, dM/dt = -P(M, a, Q) / c².<br>
+    Spin and charge decrease in proportion to the mass, so that the dimensionless spin and charge stay constant (like the evaporation times in `formulas` assume).
+    """
+    dM = -BlackHolePopulation._unchecked(mass, spin, charge).hawking_power / _C**2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        per_mass = np.where(mass > 0, dM / mass, 0)
+    return dM, spin * per_mass, charge * per_mass
+
+def evolve(
+        population: BlackHolePopulation,
+        times: np.ndarray,
+        rates: Rates = hawking_rates,
+        rtol: float = 1e-8,
+        atol: float = 0.0,
+        max_steps: int = 100_000,
+        warn_on_evaporation: bool = True,
+        power_law_tail: bool | None = None
+    ) -> Evolution:
+    """Integrates mass, spin and charge of every black hole with an adaptive Runge-Kutta method (Dormand-Prince 5(4)).
+
+    Every black hole has its own step size, but all of them are stepped together as array operations.
+    The state is recorded at each of the ascending `times` (in seconds, starting with the population as it is at time 0).
+    With `power_law_tail`, once a black hole has lost all but a fraction of rtol^(1/3) of its mass, the rest of its evaporation follows
+    the power law of Hawking radiation, M ∝ (τ - t)^(1/3), instead of being integrated with ever smaller steps.
+    Spin and charge follow the same power law, which is exact for `hawking_rates`.
+    By default (None) this is done only with `hawking_rates`, for other rates it's only correct if they lose mass as dM/dt ∝ -1/M².
+    Black holes whose mass reaches zero are marked as evaporated and stay at zero.
+    Black holes whose rates can't be calculated (NaN, e.g. missing formulas of their metric) are kept constant with a warning.
+    """
+    times = np.asarray(times, dtype=float)
+    if times.ndim != 1 or (times < 0).any() or (np.diff(times) < 0).any():
+        raise ValueError("times have to be a one-dimensional array of ascending non-negative numbers")
+
+    y = np.stack([population.mass, population.spin, population.charge]).astype(float)
+    n = y.shape[1]
+    initial_mass = y[0].copy()
+
+    record = np.empty((len(times), 3, n))
+    t = np.zeros(n)
+    h = np.full(n, np.nan)
+    evaporated = y[0] == 0
+    frozen = ~np.isfinite(np.stack(rates(*y))).all(axis=0) & ~evaporated
+    steps = 0
+
+    # Endphase: ab tail_time zerstrahlt der Restzustand tail_state in tail_lifetime Sekunden
+    if power_law_tail is None:
+        power_law_tail = rates is hawking_rates
+    tail_floor = rtol ** (1/3) * initial_mass if power_law_tail else np.full(n, -np.inf)
+    tail_time, tail_state, tail_lifetime = np.full(n, np.nan), np.zeros((3, n)), np.zeros(n)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for i, target in enumerate(times):
+            while True:
+                active = np.flatnonzero((t < target) & ~evaporated & ~frozen & np.isnan(tail_time))
+                if active.size == 0:
+                    break
+                if steps >= max_steps:
+                    raise RuntimeError(f"Integration didn't reach {target} seconds within {max_steps} steps")
+                steps += 1
+
+                ya, ta = y[:, active], t[active]
+                k = np.empty((7, 3, active.size))
+                k[0] = np.stack(rates(*ya))
+
+                # Startschrittweite aus der Zeitskala der Massenänderung
+                proposed = h[active]
+                unset = np.isnan(proposed)
+                proposed[unset] = np.nan_to_num(0.01 * ya[0, unset] / np.abs(k[0, 0, unset]), nan=np.inf, posinf=np.inf)
+                ha = np.minimum(proposed, target - ta)
+
+                for s in range(1, 7):
+                    stage = ya + ha * np.tensordot(_A[s], k[:s], axes=1)
+                    k[s] = np.stack(rates(*stage))
+
+                y_new = ya + ha * np.tensordot(_B, k, axes=1)
+                error = ha * np.tensordot(_B_ERROR, k, axes=1)
+                scale = atol + rtol * np.maximum(np.abs(ya), np.abs(y_new))
+                ratio = np.where(error == 0, 0, np.abs(error) / scale)
+                norm = np.nan_to_num(ratio.max(axis=0), nan=np.inf)
+                # eine negative Masse bedeutet, dass das Schwarze Loch innerhalb des Schritts zerstrahlt: Schritt verkleinern
+                negative = y_new[0] < 0
+                norm[negative] = np.inf
+
+                # zerstrahlt es innerhalb der Auflösung der Zeit, kann t nicht mehr weiterlaufen: es gilt als zerstrahlt
+                resolution = np.finfo(float).eps * np.maximum(ta, 1)
+                vanishing = (negative & (ha <= resolution)) | (ya[0] + resolution * k[0, 0] <= 0)
+                vanished = active[vanishing]
+                y[:, vanished] = 0
+                evaporated[vanished] = True
+
+                accepted = (norm <= 1) & ~vanishing
+                factor = np.clip(_SAFETY * norm ** -0.2, _MIN_FACTOR, _MAX_FACTOR)
+                factor = np.where(np.isfinite(factor), factor, _MIN_FACTOR)
+                # auf einen Ausgabezeitpunkt gekürzte Schritte sollen die Schrittweite nicht dauerhaft verkleinern
+                h[active] = np.where(accepted & (ha < proposed), np.maximum(proposed, ha * factor), ha * factor)
+
+                rows = active[accepted]
+                y[:, rows] = y_new[:, accepted]
+                t[rows] = ta[accepted] + ha[accepted]
+
+                # für P ∝ 1/M² ist M(t) = M * (1 - t/τ)^(1/3) mit τ = M / (3 |dM/dt|)
+                ending = rows[y[0, rows] <= tail_floor[rows]]
+                if ending.size:
+                    tail_time[ending] = t[ending]
+                    tail_state[:, ending] = y[:, ending]
+                    tail_lifetime[ending] = y[0, ending] / (3 * np.abs(rates(*y[:, ending])[0]))
+
+            ending = np.flatnonzero(~np.isnan(tail_time) & ~evaporated)
+            remaining = 1 - (target - tail_time[ending]) / tail_lifetime[ending]
+            y[:, ending] = tail_state[:, ending] * np.cbrt(np.clip(remaining, 0, 1))
+            evaporated[ending[remaining <= 0]] = True
+            record[i] = y
+
+    if warn_on_evaporation and evaporated.any():
+        warnings.warn(f"{np.count_nonzero(evaporated)} of {n} black holes evaporated within {times[-1] if len(times) else 0} seconds.")
+    if frozen.any():
+        warnings.warn(f"The rates of {np.count_nonzero(frozen)} of {n} black holes can't be calculated for their metric, so they were kept constant.")
+
+    return Evolution(
+        times      = times,
+        mass       = record[:, 0],
+        spin       = record[:, 1],
+        charge     = record[:, 2],
+        evaporated = evaporated,
+        steps      = steps
+    )
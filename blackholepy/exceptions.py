@@ -11,4 +11,8 @@ class LawOfConservationOfEnergy(BlackHolePyError):
     ...
 
 class FaultyImplementation(BlackHolePyError):
-    ...
\ No newline at end of file
+    ...
+
+class DimensionalInconsistency(FaultyImplementation):
+    "Raised when a formula adds or equates quantities of different physical dimensions."
+    ...
@@ -1,10 +1,44 @@
-from sympy import Equality, sqrt, solve, Symbol, Expr, Integral
-from dataclasses import dataclass
+from sympy import Equality, sqrt, Symbol, Expr, Basic, Integral
+from dataclasses import dataclass, field
 from typing import Literal
+import warnings
 
 from blackholepy.symbols import *
+from blackholepy import backends
+from blackholepy.backends import solved, compiled
+from blackholepy.physics.utils import DimensionTable, vector
 import blackholepy.config as config
 
+# Formeln werden mit den Naturkonstanten als Symbolen aufgestellt und erst dann mit ihren Werten versehen
+_c, _G, _ℏ, _k_B, _ε_0 = constant_symbols
+
+dimensional: dict[Equality, Equality] = {}
+"The form of every formula with the natural constants as symbols, by the formula with their values, for checking its dimensions"
+
+def _valued(eq: Equality) -> Equality:
+    valued = eq.xreplace(constant_symbols)
+    dimensional[valued] = eq
+    return valued
+
+# Hawking-Strahlung als Schwarzkörperstrahlung des Horizonts: P = σ T_H⁴ A
+_schwarzschild_power: Expr = (_ℏ * _c**6) / (15360 * pi * _G**2 * M**2)
+_schwarzschild_lifetime: Expr = (5120 * pi * _G**2 * M**3) / (_ℏ * _c**4)
+
+# Quadrat der dimensionslosen Ladung q* = Q / (sqrt(4πε_0G) M)
+_q_star_squared: Expr = Q**2 / (4 * pi * _ε_0 * _G * M**2)
+
+# (T_H / T_S)⁴ · A / A_S gegenüber einem Schwarzschild-Loch gleicher Masse, mit x = sqrt(1 - a*² - q*²):
+# T_H / T_S = 4x / ((1 + x)² + a*²) und A / A_S = ((1 + x)² + a*²) / 4
+_x_RN: Expr = sqrt(1 - _q_star_squared)
+_x_Kerr: Expr = sqrt(1 - a_star**2)
+_x_KN: Expr = sqrt(1 - a_star**2 - _q_star_squared)
+
+_radiation_RN: Expr = 64 * _x_RN**4 / (1 + _x_RN)**6
+_radiation_Kerr: Expr = 8 * _x_Kerr**4 / (1 + _x_Kerr)**3
+_radiation_KN: Expr = 64 * _x_KN**4 / ((1 + _x_KN)**2 + a_star**2)**3
+
+# Die Lebensdauer nimmt an, dass a* und q* während der Zerstrahlung konstant bleiben, sodass wie bei Schwarzschild P ∝ 1/M² und τ ∝ M³ gilt
+
 @dataclass(eq=True)
 class BlackHoleMetric():
     """Class representing a set of formulas rigarding properties of black holes, result from a solution to the Einstein field equations and are true under certain circumstances."""
@@ -17,6 +51,29 @@ class BlackHoleMetric():
     hawking_temperature: Equality
     hawking_power:       Equality
     evaporation_time:    Equality
+    implemented:         frozenset[str] = field(init=False, repr=False, compare=False)
+    "Names of the formulas the metric has, those not yet implemented are `...`"
+
+    def __post_init__(self):
+        for name, value in vars(self).items():
+            if isinstance(value, Equality):
+                setattr(self, name, _valued(value))
+        self.implemented = frozenset(name for name, value in vars(self).items() if isinstance(value, Equality))
+
+    def formula(self, name: str) -> Equality:
+        """The metric's formula `name`, e.g. `"hawking_power"`
+
+        Raises
+        ----------
+        NotImplementedError : If the metric doesn't have the formula yet
+        """
+        if name not in self.implemented:
+            raise NotImplementedError(
+                f"Calculation of '{name}' has not yet been implemented for {self} black holes.\n" +
+                f"It is not definitely stated, but this is most certainly the case, because the dependencies of the parameters are non-trivial "
+                f"and thus, a calculation process would be very complex."
+            )
+        return getattr(self, name)
 
     def __repr__(self):
         return f"<BlackHoleMetric '{self.name}'>"
@@ -26,55 +83,67 @@ class BlackHoleMetric():
 
 SchwarzschildMetric = BlackHoleMetric(
     name                    = "Schwarzschild metric",
-    r_plus                  = Equality(r_plus, (2 * G * M) / c**2),
-    r_minus                 = Equality(r_minus, (2 * G * M) / c**2),
-    surface_gravity         = Equality(κ, c**4 / (4 * G * M)),
+    r_plus                  = Equality(r_plus, (2 * _G * M) / _c**2),
+    r_minus                 = Equality(r_minus, (2 * _G * M) / _c**2),
+    surface_gravity         = Equality(κ, _c**4 / (4 * _G * M)),
     horizon_area            = Equality(A, 4 * pi * r_plus**2),
-    hawking_temperature     = Equality(T_H, (ℏ * κ) / (2 * pi * k_B * c)),
-    hawking_power           = Equality(P, (ℏ * c**6) / (15360 * pi * G**2 * M **2)),
-    evaporation_time        = Equality(τ, (5120 * pi * G**2 * M**3) / (ℏ * c**4))
+    hawking_temperature     = Equality(T_H, (_ℏ * κ) / (2 * pi * _k_B * _c)),
+    hawking_power           = Equality(P, _schwarzschild_power),
+    evaporation_time        = Equality(τ, _schwarzschild_lifetime)
 )
 
 ReissnerNordströmMetric = BlackHoleMetric(
     name                    = "Reissner-Nordström metric",
-    r_plus                  = Equality(r_plus, ((G * M) / c**2) + (sqrt(((G * M) / c**2)**2 - ((G * Q**2) / (4 * pi * ε_0 * c**4))))),
-    r_minus                 = Equality(r_minus, ((G * M) / c**2) - (sqrt(((G * M) / c**2)**2 - ((G * Q**2) / (4 * pi * ε_0 * c**4))))),
-    surface_gravity         = Equality(κ, (c**4 / (4 * G * M)) * (1 - ((Q**2 * G) / (4 * pi * ε_0 * c**4 * M**2)))),
+    r_plus                  = Equality(r_plus, ((_G * M) / _c**2) + (sqrt(((_G * M) / _c**2)**2 - ((_G * Q**2) / (4 * pi * _ε_0 * _c**4))))),
+    r_minus                 = Equality(r_minus, ((_G * M) / _c**2) - (sqrt(((_G * M) / _c**2)**2 - ((_G * Q**2) / (4 * pi * _ε_0 * _c**4))))),
+    surface_gravity         = Equality(κ, (_c**4 / (4 * _G * M)) * (1 - ((Q**2 * _G) / (4 * pi * _ε_0 * _c**4 * M**2)))),
     horizon_area            = Equality(A, 4 * pi * r_plus**2),
-    hawking_temperature     = Equality(T_H, ((ℏ * c**3) / (2 * pi * k_B * G * M)) * sqrt(1 - ((Q**2 * G) / (4 * pi * ε_0 * c**4 * M**2)))),
-    hawking_power           = ...,
-    evaporation_time        = ... # Equality(τ, Integral())
+    hawking_temperature     = Equality(T_H, ((_ℏ * _c**3) / (2 * pi * _k_B * _G * M)) * sqrt(1 - ((Q**2 * _G) / (4 * pi * _ε_0 * _c**4 * M**2)))),
+    hawking_power           = Equality(P, _schwarzschild_power * _radiation_RN),
+    evaporation_time        = Equality(τ, _schwarzschild_lifetime / _radiation_RN)
 )
 
 KerrMetric = BlackHoleMetric(
     name                    = "Kerr metric",
-    r_plus                  = Equality(r_plus, ((G * M) / c**2) + (sqrt(((G * M) / c**2)**2 - a**2))),
-    r_minus                 = Equality(r_minus, ((G * M) / c**2) - (sqrt(((G * M) / c**2)**2 - a**2))),
-    surface_gravity         = Equality(κ, c**2 * sqrt(((G * M) / c**2)**2 - a**2) / (r_plus**2 + a**2)),
+    r_plus                  = Equality(r_plus, ((_G * M) / _c**2) + (sqrt(((_G * M) / _c**2)**2 - a**2))),
+    r_minus                 = Equality(r_minus, ((_G * M) / _c**2) - (sqrt(((_G * M) / _c**2)**2 - a**2))),
+    surface_gravity         = Equality(κ, _c**2 * sqrt(((_G * M) / _c**2)**2 - a**2) / (r_plus**2 + a**2)),
     horizon_area            = Equality(A, 4 * pi * (r_plus**2 + a**2)),
-    hawking_temperature     = Equality(T_H, ((ℏ * c**3) / (2 * pi * k_B * G * M)) * ((sqrt(1 - a_star**2)) / (1 + sqrt(1 - a_star**2)))),
-    hawking_power           = ...,
-    evaporation_time        = ...
+    hawking_temperature     = Equality(T_H, ((_ℏ * _c**3) / (2 * pi * _k_B * _G * M)) * ((sqrt(1 - a_star**2)) / (1 + sqrt(1 - a_star**2)))),
+    hawking_power           = Equality(P, _schwarzschild_power * _radiation_Kerr),
+    evaporation_time        = Equality(τ, _schwarzschild_lifetime / _radiation_Kerr)
 )
 
 KerrNewmanMetric = BlackHoleMetric(
     name                    = "Kerr-Newman metric",
-    r_plus                  = Equality(r_plus, ((G * M) / c**2) + (sqrt(((G * M) / c**2)**2 - ((G * Q**2) / (4 * pi * ε_0 * c**4)) - (a**2 / c**2)))),
-    r_minus                 = Equality(r_minus, ((G * M) / c**2) - (sqrt(((G * M) / c**2)**2 - ((G * Q**2) / (4 * pi * ε_0 * c**4)) - (a**2 / c**2)))),
-    surface_gravity         = Equality(κ, (c**4 * (r_plus - r_minus)) / (2 * G * (r_plus**2 + a**2))),
+    r_plus                  = Equality(r_plus, ((_G * M) / _c**2) + (sqrt(((_G * M) / _c**2)**2 - ((_G * Q**2) / (4 * pi * _ε_0 * _c**4)) - (a**2 / _c**2)))),
+    r_minus                 = Equality(r_minus, ((_G * M) / _c**2) - (sqrt(((_G * M) / _c**2)**2 - ((_G * Q**2) / (4 * pi * _ε_0 * _c**4)) - (a**2 / _c**2)))),
+    surface_gravity         = Equality(κ, (_c**4 * (r_plus - r_minus)) / (2 * _G * (r_plus**2 + a**2))),
     horizon_area            = Equality(A, 4 * pi * (r_plus**2 + a**2)),
-    hawking_temperature     = Equality(T_H, ((ℏ * c**3) / (2 * pi * k_B * G * M)) * (sqrt(M**2 - a**2 + ((Q**2 * G) / (4 * pi * ε_0 * c**4))) / ((M + sqrt(M**2 - a**2 + ((Q**2 * G) / (4 * pi * ε_0 * c**4))))**2 + a**2))),
-    hawking_power           = ...,
-    evaporation_time        = ...
+    hawking_temperature     = Equality(T_H, ((_ℏ * _c**3) / (2 * pi * _k_B * _G * M)) * (sqrt(M**2 - a**2 + ((Q**2 * _G) / (4 * pi * _ε_0 * _c**4))) / ((M + sqrt(M**2 - a**2 + ((Q**2 * _G) / (4 * pi * _ε_0 * _c**4))))**2 + a**2))),
+    hawking_power           = Equality(P, _schwarzschild_power * _radiation_KN),
+    evaporation_time        = Equality(τ, _schwarzschild_lifetime / _radiation_KN)
 )
 
-spin_momentum: Equality = Equality(a, (J / M))
+spin_momentum: Equality = _valued(Equality(a, (J / M)))
+
+dimensionless_spin: Equality = _valued(Equality(a_star, a / ((_G * M) / _c**2)))
+
+irreducable_mass: Equality = _valued(Equality(M_irr, sqrt((_c**4 * A) / (16 * pi * _G**2))))
+
+entropy: Equality = _valued(Equality(S, (_k_B * _c**3 * A) / (4 * _G * _ℏ)))
+
+radius: Equality = _valued(Equality(R, r_plus))
+
+volume: Equality = _valued(Equality(V, R**3 * π * 4/3))
+
+density: Equality = _valued(Equality(ρ, M / V))
 
-dimensionless_spin: Equality = Equality(a_star, a / ((G * M) / c**2))
+max_spin: Equality = _valued(Equality(a, (_G * M) / _c**2))
 
-irreducable_mass: Equality = Equality(M_irr, sqrt((c**4 * A) / (16 * pi * G**2)))
+max_charge: Equality = _valued(Equality(Q, sqrt(4 * π * _ε_0 * _G) * M))
 
-entropy: Equality = Equality(S, (k_B * c**3 * A) / (4 * G * ℏ))
+christodoulou_mass: Equality = _valued(Equality(M, sqrt(M_irr**2 + (J**2 * _c**2) / (4 * _G**2 * M_irr**2))))
 
 def calculate(
     eq: Equality,
@@ -85,8 +154,17 @@ def calculate(
 ) -> Expr | set[Expr | float]:
     
     
-    # 1. Lösen der Gleichung symbolisch
-    formulas: list[Expr] = solve(eq, unknown)
+    # 1. Lösen der Gleichung symbolisch (zwischengespeichert)
+    formulas: tuple[Expr, ...] = solved(eq, unknown)
+
+    # 2. Numerische Backends werten die kompilierten Lösungen direkt aus, sofern alle Werte bekannt sind
+    backend = backends.current()
+    known = {s: v for s, v in values.items() if v is not None}
+    if not backend.exact and all(formula.free_symbols <= known.keys() for formula in formulas):
+        evaluated = [backend.evaluate(eq, unknown, known, solution=i) for i in range(len(formulas))]
+        if mode == "single":
+            return evaluated[0]
+        return set(evaluated)
 
     substituted = [
         formula.subs({s: v for s, v in values.items() if v is not None})
@@ -103,10 +181,47 @@ def calculate(
     return set(evaluated)
 
 def approx(expr: Expr, precision: int = config.float_precision):
+    if not isinstance(expr, Basic):
+        # Zahlen der numerischen Backends
+        return expr
     return expr.evalf(
         n=precision,
         subs=constants,
         strict=True,
         verbose=False,
         maxn=300
-    )
\ No newline at end of file
+    )
+
+dimension_table: DimensionTable = DimensionTable({
+    A:       vector(length=2),
+    a:       vector(length=1),
+    a_star:  vector(),
+    J:       vector(mass=1, length=2, time=-1),
+    M:       vector(mass=1),
+    M_irr:   vector(mass=1),
+    P:       vector(mass=1, length=2, time=-3),
+    Q:       vector(current=1, time=1),
+    R:       vector(length=1),
+    r_minus: vector(length=1),
+    r_plus:  vector(length=1),
+    S:       vector(mass=1, length=2, time=-2, temperature=-1),
+    T_H:     vector(temperature=1),
+    V:       vector(length=3),
+    τ:       vector(time=1),
+    ρ:       vector(mass=1, length=-3),
+    κ:       vector(length=1, time=-2),
+    _c:      vector(length=1, time=-1),
+    _G:      vector(length=3, mass=-1, time=-2),
+    _ℏ:      vector(mass=1, length=2, time=-1),
+    _k_B:    vector(mass=1, length=2, time=-2, temperature=-1),
+    _ε_0:    vector(mass=-1, length=-3, time=4, current=2)
+})
+"Dimensions of the quantities and natural constants in the formulas (spins `a` in meters)"
+
+def check_dimensions() -> dict[Equality, str]:
+    "Checks the dimensions of all formulas at once, returning the reason for each inconsistent one"
+    return dimension_table.inconsistencies(dimensional.values())
+
+if config.check_dimensions:
+    for eq, reason in check_dimensions().items():
+        warnings.warn(f"Formula {eq.lhs} = {eq.rhs} is dimensionally inconsistent. {reason}")
@@ -0,0 +1,177 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Literal
+
+from sympy import Equality, Expr, Symbol, srepr
+
+from blackholepy import formulas, cache
+from blackholepy.backends import solved, lambdified
+from blackholepy.exceptions import FaultyImplementation
+from blackholepy.formulas import BlackHoleMetric
+
+@dataclass(frozen=True)
+class Formula():
+    "An equation solved for one of its quantities"
+    equation: Equality
+    output:   Symbol
+
+    def __repr__(self):
+        return f"Formula({self.output} <- {', '.join(sorted(map(str, self.inputs)))})"
+
+    @property
+    def inputs(self) -> frozenset[Symbol]:
+        "Quantities needed to calculate the output"
+        return frozenset(self.equation.free_symbols - {self.output})
+
+    @property
+    def explicit(self) -> bool:
+        "Whether the equation already states the output, so that it doesn't have to be solved for it"
+        return self.equation.lhs == self.output and self.output not in self.equation.rhs.free_symbols
+
+    @property
+    def expression(self) -> Expr:
+        if self.explicit:
+            return self.equation.rhs
+        solutions = _solved_positive(self.equation, self.output)
+        if not solutions:
+            raise FaultyImplementation(f"Cannot solve equation for {self.output}: {self.equation}")
+        return solutions[0]
+
+    @property
+    def unique(self) -> bool:
+        "Whether the equation has exactly one solution for the output (for positive quantities)"
+        return self.explicit or len(_solved_positive(self.equation, self.output)) == 1
+
+@lru_cache(maxsize=None)
+def _solved_positive(eq: Equality, unknown: Symbol) -> tuple[Expr, ...]:
+    "Solutions of `eq` for `unknown`, if all quantities are positive, which excludes e.g. negative radii of `A = 4πr²`"
+    positive = {symbol: Symbol(symbol.name, positive=True) for symbol in eq.free_symbols}
+    back = {value: key for key, value in positive.items()}
+    return tuple(solution.xreplace(back) for solution in solved(eq.xreplace(positive), positive[unknown]))
+
+class FormulaGraph():
+    """Quantities of black holes connected by the formulas between them.
+
+    Every equation is a formula for each of its quantities, computed from the others.
+    Which formulas are needed to calculate a quantity from some known quantities is resolved by forward chaining,
+    so any quantity can be calculated from any sufficient set of known quantities, without recursion.
+    """
+
+    def __init__(self, equations: Iterable[Equality]):
+        # nicht implementierte Formeln der Metriken sind `...`
+        self.equations: tuple[Equality, ...] = tuple(eq for eq in equations if isinstance(eq, Equality))
+        self.formulas: list[Formula] = [
+            Formula(eq, symbol)
+            for eq in self.equations
+            for symbol in sorted(eq.free_symbols, key=str)
+        ]
+        self.formulas.sort(key=lambda formula: not formula.explicit)
+
+    def __repr__(self):
+        return f"<FormulaGraph of {len(self.formulas)} formulas>"
+
+    @property
+    def quantities(self) -> set[Symbol]:
+        return {formula.output for formula in self.formulas}
+
+    def plan(self, targets: Iterable[Symbol], known: Iterable[Symbol]) -> tuple[Formula, ...]:
+        """Formulas needed to calculate `targets` from the `known` quantities, each one after those calculating its inputs.
+
+        Raises
+        ----------
+        FaultyImplementation : If the known quantities don't suffice
+        """
+        targets = set(targets)
+        derived: dict[Symbol, Formula | None] = {symbol: None for symbol in known}
+
+        # Vorwärtsverkettung: Umkehrungen von Formeln nur, wenn mit expliziten Formeln nichts mehr folgt
+        while not targets <= derived.keys():
+            for explicit_only in (True, False):
+                new = [
+                    formula for formula in self.formulas
+                    if formula.output not in derived and formula.inputs <= derived.keys()
+                    and (formula.explicit or (not explicit_only and formula.unique))
+                ]
+                for formula in new:
+                    derived.setdefault(formula.output, formula)
+                if new:
+                    break
+            else:
+                missing = ", ".join(sorted(map(str, targets - derived.keys())))
+                raise FaultyImplementation(f"Can't calculate {missing} from {', '.join(sorted(map(str, known))) or 'nothing'}")
+
+        # Rückwärts nur die benötigten Formeln sammeln; `derived` ist bereits topologisch sortiert
+        needed: set[Symbol] = set()
+        stack = list(targets)
+        while stack:
+            symbol = stack.pop()
+            if symbol not in needed:
+                needed.add(symbol)
+                if derived[symbol] is not None:
+                    stack.extend(derived[symbol].inputs)
+
+        return tuple(formula for symbol, formula in derived.items() if symbol in needed and formula is not None)
+
+    def compile(self, target: Symbol | Formula, known: Iterable[Symbol], module: Literal["sympy", "numpy", "math", "mpmath"] = "sympy") -> tuple[tuple[Symbol, ...], Callable[..., Any]]:
+        """Compiles the calculation of `target` from the `known` quantities into one function.<br>
+        `target` is either a quantity or a formula, whose inputs are calculated from the known quantities.
+        All formulas on the way are composed into one expression, so that common sub-expressions are evaluated only once.
+        Returns the known quantities the function takes in that order, together with the function.<br>
+        Compiled functions are also stored in the on-disk cache, if `config.formula_cache` is set.
+        """
+        return _compile(self, target, frozenset(known), module)
+
+    @property
+    def _key(self) -> tuple[str, ...]:
+        return tuple(srepr(eq) for eq in self.equations)
+
+@lru_cache(maxsize=None)
+def _compile(graph: FormulaGraph, target: Symbol | Formula, known: frozenset[Symbol], module: str) -> tuple[tuple[Symbol, ...], Callable[..., Any]]:
+    key = None
+    if cache.enabled():
+        target_key = (srepr(target.equation), srepr(target.output)) if isinstance(target, Formula) else (srepr(target),)
+        key = cache.key("graph", module, *graph._key, *target_key, *sorted(srepr(symbol) for symbol in known))
+        if (entry := cache.load(key, module)) is not None:
+            names, function = entry
+            symbols = {symbol.name: symbol for symbol in known}
+            return tuple(symbols[name] for name in names), function
+
+    expr = target.expression if isinstance(target, Formula) else target
+
+    substitutions: dict[Symbol, Expr] = {}
+    for formula in graph.plan(expr.free_symbols - known, known):
+        substitutions[formula.output] = formula.expression.xreplace(substitutions)
+
+    expr = expr.xreplace(substitutions)
+    args = tuple(sorted(expr.free_symbols, key=str))
+    function = lambdified(args, expr, module, cse=True)
+    if key is not None:
+        cache.store(key, tuple(symbol.name for symbol in args), function)
+    return args, function
+
+_GENERAL_EQUATIONS: tuple[Equality, ...] = (
+    formulas.spin_momentum,
+    formulas.dimensionless_spin,
+    formulas.irreducable_mass,
+    formulas.entropy,
+    formulas.radius,
+    formulas.volume,
+    formulas.density
+)
+
+_graphs: dict[str, FormulaGraph] = {}
+
+def metric_graph(metric: BlackHoleMetric) -> FormulaGraph:
+    "Formula graph of the metric's formulas together with those true for every black hole"
+    if metric.name not in _graphs:
+        _graphs[metric.name] = FormulaGraph((
+            metric.r_plus,
+            metric.r_minus,
+            metric.surface_gravity,
+            metric.horizon_area,
+            metric.hawking_temperature,
+            metric.hawking_power,
+            metric.evaporation_time,
+            *_GENERAL_EQUATIONS
+        ))
+    return _graphs[metric.name]
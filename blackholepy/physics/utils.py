@@ -1,30 +1,156 @@
-from sympy import Expr, Mul, Add, Pow
-from sympy.physics.units import Dimension
-from sympy.physics.units.quantities import Quantity
+from fractions import Fraction
+from typing import TYPE_CHECKING, Iterable, Mapping
 
+from sympy import Add, Basic, Equality, Expr, Function, Mul, NumberSymbol, Pow, Rational, Symbol
 
-def dimensions(expr: Expr) -> Dimension | list[Dimension]:
+from blackholepy.exceptions import DimensionalInconsistency
+
+if TYPE_CHECKING:
+    from sympy.physics.units import Dimension
+
+BASE_DIMENSIONS: tuple[str, ...] = ("length", "mass", "time", "current", "temperature")
+"Order of the exponents of the SI base dimensions in a `Vector`"
+
+Vector = tuple[Fraction, ...]
+"Exponents of the base dimensions of a quantity, e.g. `(1, 0, -1, 0, 0)` for a velocity"
+
+def vector(**exponents: int | Fraction) -> Vector:
+    "Dimension vector of the given exponents, e.g. `vector(length=1, time=-1)`"
+    if unknown := exponents.keys() - set(BASE_DIMENSIONS):
+        raise ValueError(f"Unknown base dimensions {', '.join(sorted(unknown))}, choose of {', '.join(BASE_DIMENSIONS)}")
+    return tuple(Fraction(exponents.get(base, 0)) for base in BASE_DIMENSIONS)
+
+DIMENSIONLESS: Vector = vector()
+
+class DimensionTable():
+    """Physical dimensions of symbols, from which those of expressions made of them are inferred.
+
+    Inferred dimensions are cached per expression, so sub-expressions shared by many formulas (like `G*M/c**2`) are only inferred once.
+    """
+
+    def __init__(self, symbols: Mapping[Symbol, Vector]):
+        self.symbols: dict[Symbol, Vector] = dict(symbols)
+        self._cache: dict[Basic, Vector] = {}
+
+    def __repr__(self):
+        return f"<DimensionTable of {len(self.symbols)} symbols>"
+
+    def of(self, expr: Expr) -> Vector:
+        """Dimension vector of `expr`
+
+        Raises
+        ----------
+        DimensionalInconsistency : If `expr` adds quantities of different dimensions, takes a dimensional quantity to a non-rational power or contains unknown symbols
+        """
+        if (dimension := self._cache.get(expr)) is None:
+            dimension = self._cache[expr] = self._infer(expr)
+        return dimension
+
+    def _infer(self, expr: Basic) -> Vector:
+        if expr in self.symbols:
+            return self.symbols[expr]
+
+        if expr.is_Number or isinstance(expr, NumberSymbol):
+            return DIMENSIONLESS
+
+        if isinstance(expr, Mul):
+            return _sum(self.of(factor) for factor in expr.args)
+
+        if isinstance(expr, Pow):
+            base = self.of(expr.base)
+            if base == DIMENSIONLESS:
+                self._dimensionless(expr.exp, expr)
+                return DIMENSIONLESS
+            if not isinstance(expr.exp, Rational):
+                raise DimensionalInconsistency(f"Can't take {expr.base} to the power of {expr.exp}, which isn't a rational number")
+            exponent = Fraction(expr.exp.p, expr.exp.q)
+            return tuple(exponent * e for e in base)
+
+        if isinstance(expr, Add):
+            dimensions = {self.of(term) for term in expr.args}
+            if len(dimensions) > 1:
+                raise DimensionalInconsistency(f"Can't add quantities of different dimensions: {expr}")
+            return dimensions.pop()
+
+        if isinstance(expr, Function):
+            # exp, log, sin, ... sind nur für dimensionslose Argumente definiert
+            for arg in expr.args:
+                self._dimensionless(arg, expr)
+            return DIMENSIONLESS
+
+        from sympy.physics.units.quantities import Quantity
+        if isinstance(expr, Quantity):
+            return _si(expr.dimension)
+
+        if isinstance(expr, Symbol):
+            raise DimensionalInconsistency(f"The dimension of '{expr}' is unknown")
+        raise DimensionalInconsistency(f"Can't infer the dimension of {expr}")
+
+    def _dimensionless(self, expr: Expr, within: Expr) -> None:
+        if self.of(expr) != DIMENSIONLESS:
+            raise DimensionalInconsistency(f"'{expr}' has to be dimensionless in {within}")
+
+    def check(self, eq: Equality) -> None:
+        """Checks that both sides of `eq` have the same dimension
+
+        Raises
+        ----------
+        DimensionalInconsistency : If they don't or either side is inconsistent itself
+        """
+        lhs, rhs = self.of(eq.lhs), self.of(eq.rhs)
+        if lhs != rhs:
+            raise DimensionalInconsistency(f"{eq.lhs} has the dimension {_format(lhs)}, but {eq.rhs} has {_format(rhs)}")
+
+    def inconsistencies(self, equations: Iterable[Equality]) -> dict[Equality, str]:
+        "Checks many equations at once, returning the reason for each inconsistent one"
+        found = {}
+        for eq in equations:
+            try:
+                self.check(eq)
+            except DimensionalInconsistency as e:
+                found[eq] = str(e)
+        return found
+
+def _sum(vectors: Iterable[Vector]) -> Vector:
+    total = DIMENSIONLESS
+    for v in vectors:
+        total = tuple(a + b for a, b in zip(total, v))
+    return total
+
+def _si(dimension: "Dimension") -> Vector:
+    from sympy.physics.units.systems.si import dimsys_SI
+    dependencies = dimsys_SI.get_dimensional_dependencies(dimension)
+    names = {"amount_of_substance", "luminous_intensity"} & {str(d.name) for d in dependencies}
+    if names:
+        raise DimensionalInconsistency(f"Base dimensions {', '.join(names)} aren't supported")
+    return vector(**{str(d.name): Fraction(int(e.p), int(e.q)) if isinstance(e, Rational) else Fraction(e) for d, e in dependencies.items()})
+
+def _format(v: Vector) -> str:
+    return " ".join(f"{base}^{e}" for base, e in zip(BASE_DIMENSIONS, v) if e) or "1"
+
+def dimensions(expr: Expr) -> "Dimension | list[Dimension]":
     """
     Returns a list of the physical dimensions of a Expr object when multiplied
     """
+    from sympy.physics.units.quantities import Quantity
 
-    dimensions = []
+    found = []
 
     for factor in expr.as_ordered_factors():
         if isinstance(factor, Quantity):
-            dimensions.append(factor.dimension)
+            found.append(factor.dimension)
 
         elif isinstance(factor, Pow):
             base, exp = factor.as_base_exp()
             if isinstance(base, Quantity):  # Basis ist eine Einheit
-                dimensions.append(base.dimension ** exp)
+                found.append(base.dimension ** exp)
 
         elif isinstance(factor, Mul):  # Rekursive Zerlegung für verschachtelte Multiplikation
             sub_dimensions = dimensions(factor)
-            dimensions.extend(sub_dimensions)
+            found.extend(sub_dimensions if isinstance(sub_dimensions, list) else [sub_dimensions])
 
         elif isinstance(factor, Add):
             raise ValueError("Can't use additions of dimensions properly")
 
-    if len(dimensions) == 1: dimensions = dimensions[0]
-    return dimensions
\ No newline at end of file
+    if len(found) == 1: found = found[0]
+    return found
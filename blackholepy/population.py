@@ -0,0 +1,208 @@
+from dataclasses import dataclass, field
+from typing import Callable
+
+import numpy as np
+from sympy import Equality, Rational
+
+from blackholepy import formulas
+from blackholepy.blackhole import BlackHole
+from blackholepy.graph import Formula, metric_graph
+from blackholepy.formulas import BlackHoleMetric, KerrMetric, KerrNewmanMetric, SchwarzschildMetric, ReissnerNordströmMetric
+from blackholepy.symbols import *
+from blackholepy.exceptions import *
+
+@dataclass
+class BlackHolePopulation():
+    """Class representing many black holes at once, storing their parameters as float64 NumPy arrays.
+
+    Parameters
+    ----------
+    mass : kilogram as array
+    spin : meter as array
+        The Kerr-parameter *a* of every black hole, see `BlackHole`.
+    charge : coloumb as array
+
+    The parameters are broadcast against each other. Every property is evaluated as an array operation over the whole population,
+    using the formulas of the metric each black hole has by its spin and charge (see `masks`).
+    Properties a metric has no formula for yet are NaN for the black holes of that metric.<br>
+    Assign new arrays to `mass`, `spin` or `charge` instead of modifying them in place, so that cached properties are recalculated.
+
+    Raises
+    ----------
+    CosmicCensorshipHypothesis : If parameters exceed certain limits, so that event horizons become imaginary
+    LawOfConservationOfEnergy : If parameters cause behavior that would destroy energy or create it out of nothing
+    """
+
+    mass:   np.ndarray
+    spin:   np.ndarray = 0
+    charge: np.ndarray = 0
+    _cache: dict[str, np.ndarray] = field(init=False, default_factory=dict, repr=False, compare=False)
+
+    def __post_init__(self):
+        arrays = np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=float)) for v in (self.mass, self.spin, self.charge)))
+        # broadcast_arrays liefert schreibgeschützte Views
+        self.mass, self.spin, self.charge = (array.ravel().copy() for array in arrays)
+
+        if (self.mass < 0).any():
+            raise LawOfConservationOfEnergy("Negative mass contradicts the general theory of relativity.")
+
+        if (np.abs(self.spin) > self._max_allowed_spin).any():
+            raise CosmicCensorshipHypothesis(f"The amount of spin of {np.count_nonzero(np.abs(self.spin) > self._max_allowed_spin)} black holes violates the cosmic censorship hypothesis.")
+
+        if (np.abs(self.charge) > self._max_allowed_charge).any():
+            raise CosmicCensorshipHypothesis(f"The amount of charge of {np.count_nonzero(np.abs(self.charge) > self._max_allowed_charge)} black holes violates the cosmic censorship hypothesis.")
+
+    @classmethod
+    def _unchecked(cls, mass: np.ndarray, spin: np.ndarray, charge: np.ndarray) -> "BlackHolePopulation":
+        "Creates a population from float arrays of equal shape without validating them"
+        obj = object.__new__(cls)
+        obj.__dict__.update(mass=mass, spin=spin, charge=charge, _cache={})
+        return obj
+
+    @classmethod
+    def from_black_holes(cls, black_holes: list[BlackHole]) -> "BlackHolePopulation":
+        return cls(
+            [float(bh.mass) for bh in black_holes],
+            [float(bh.spin) for bh in black_holes],
+            [float(bh.charge) for bh in black_holes]
+        )
+
+    def __repr__(self):
+        return f"BlackHolePopulation(n={len(self)})"
+
+    def __len__(self) -> int:
+        return len(self.mass)
+
+    def __getitem__(self, index: int) -> BlackHole:
+        return BlackHole(Rational(self.mass[index]), Rational(self.spin[index]), Rational(self.charge[index]))
+
+    def __setattr__(self, name, value):
+        if name in ("mass", "spin", "charge") and "_cache" in self.__dict__:
+            self._cache.clear()
+        super().__setattr__(name, value)
+
+    def advance_time(self, seconds: float, /, warn_on_evaporation: bool = True) -> None:
+        """Integrates the population `seconds` into the future, reducing the black holes' masses due to hawking radiation.<br>
+        See `blackholepy.evolution.evolve` for recording a time series instead.
+        """
+        from blackholepy.evolution import evolve
+
+        final = evolve(self, [seconds], warn_on_evaporation=warn_on_evaporation).final
+        self.mass, self.spin, self.charge = final.mass, final.spin, final.charge
+
+    @property
+    def masks(self) -> list[tuple[BlackHoleMetric, np.ndarray]]:
+        "Every metric with a boolean mask of its black holes, chosen like `BlackHole._evaluate_metric`"
+        spins, charged = self.spin != 0, self.charge != 0
+        return [
+            (SchwarzschildMetric,     ~spins & ~charged),
+            (ReissnerNordströmMetric, ~spins &  charged),
+            (KerrMetric,               spins & ~charged),
+            (KerrNewmanMetric,         spins &  charged)
+        ]
+
+    @property
+    def metric(self) -> np.ndarray:
+        "Metric of every black hole as an object array"
+        metrics = np.empty(len(self), dtype=object)
+        for metric, mask in self.masks:
+            metrics[mask] = metric
+        return metrics
+
+    def _calc_property(self, name: str, eq: Equality, unknown: Symbol) -> np.ndarray:
+        "Evaluates `eq` solved for `unknown` for every black hole"
+        return self._calc_metric_property(name, lambda metric: eq, unknown)
+
+    def _calc_metric_property(self, name: str, equation: Callable[[BlackHoleMetric], Equality], unknown: Symbol) -> np.ndarray:
+        """Evaluates the metric's formula solved for `unknown` for the black holes of every metric, NaN where there is no formula.<br>
+        The inputs of the formula are derived from mass, spin and charge by the metric's formula graph.
+        """
+        if name not in self._cache:
+            result = np.full(self.mass.shape, np.nan)
+            known = {M: self.mass, a: self.spin, Q: self.charge}
+            for metric, mask in self.masks:
+                eq = equation(metric)
+                if not mask.any() or not isinstance(eq, Equality):
+                    continue
+                args, function = metric_graph(metric).compile(Formula(eq, unknown), known, "numpy")
+                with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+                    result[mask] = function(*(known[symbol][mask] for symbol in args))
+            self._cache[name] = result
+        return self._cache[name]
+
+    @property
+    def _max_allowed_spin(self) -> np.ndarray:
+        return self._calc_property("_max_allowed_spin", formulas.max_spin, a)
+
+    @property
+    def _max_allowed_charge(self) -> np.ndarray:
+        return self._calc_property("_max_allowed_charge", formulas.max_charge, Q)
+
+    @property
+    def angular_momentum(self) -> np.ndarray:
+        "Angular momentum of the black holes"
+        return self._calc_property("angular_momentum", formulas.spin_momentum, J)
+
+    @property
+    def dimless_spin(self) -> np.ndarray:
+        return self._calc_property("dimless_spin", formulas.dimensionless_spin, a_star)
+
+    @property
+    def innerHorizon(self) -> np.ndarray:
+        "Radius of the black holes' inner event horizons"
+        return self._calc_metric_property("innerHorizon", lambda metric: metric.r_minus, r_minus)
+
+    @property
+    def outerHorizon(self) -> np.ndarray:
+        "Radius of the black holes' outer event horizons"
+        return self._calc_metric_property("outerHorizon", lambda metric: metric.r_plus, r_plus)
+
+    @property
+    def radius(self) -> np.ndarray:
+        "Radius of the black holes given by the outermost event horizon"
+        return self.outerHorizon
+
+    @property
+    def horizon_area(self) -> np.ndarray:
+        "Area of the black holes' outermost event horizons"
+        return self._calc_metric_property("horizon_area", lambda metric: metric.horizon_area, A)
+
+    @property
+    def volume(self) -> np.ndarray:
+        "Volume of the black holes, only approximated for black holes that aren't of the Schwarzschild metric"
+        return self._calc_property("volume", formulas.volume, V)
+
+    @property
+    def density(self) -> np.ndarray:
+        "Density of the black holes"
+        return self._calc_property("density", formulas.density, ρ)
+
+    @property
+    def surface_gravity(self) -> np.ndarray:
+        "Surface gravity of the black holes"
+        return self._calc_metric_property("surface_gravity", lambda metric: metric.surface_gravity, κ)
+
+    @property
+    def temperature(self) -> np.ndarray:
+        "Hawking temperature of the black holes"
+        return self._calc_metric_property("temperature", lambda metric: metric.hawking_temperature, T_H)
+
+    @property
+    def irreducible_mass(self) -> np.ndarray:
+        "Gravitational mass of the black holes that isn't a side effect of spin or charge"
+        return self._calc_property("irreducible_mass", formulas.irreducable_mass, M_irr)
+
+    @property
+    def reducable_mass(self) -> np.ndarray:
+        "Gravitational mass of the black holes that is a side effect of spin or charge"
+        return self.mass - self.irreducible_mass
+
+    @property
+    def hawking_power(self) -> np.ndarray:
+        "Power of the black holes' Hawking radiation"
+        return self._calc_metric_property("hawking_power", lambda metric: metric.hawking_power, P)
+
+    @property
+    def evaporation_time(self) -> np.ndarray:
+        "Amount of time until the black holes will have completely evaporated"
+        return self._calc_metric_property("evaporation_time", lambda metric: metric.evaporation_time, τ)
@@ -0,0 +1,32 @@
+from typing import Literal
+
+from blackholepy import cache
+
+METRICS: tuple[str, ...] = ("Schwarzschild metric", "Reissner-Nordström metric", "Kerr metric", "Kerr-Newman metric")
+
+def quantity(name: str, metric: str = "Schwarzschild metric", /, module: Literal["math", "numpy", "mpmath"] = "math", **known: float) -> float:
+    """Calculates a single quantity of a black hole of the given metric from the known quantities, e.g. `quantity("r_plus", M=1.989e30)`.<br>
+    Quantities are named like their symbols in `blackholepy.symbols` (`r_plus`, `T_H`, `τ`, ...).
+
+    With `config.formula_cache` set, the compiled calculation is loaded from disk, so that neither SymPy nor any formula has to be loaded.
+    Otherwise it is compiled from the metric's formula graph (see `blackholepy.graph`).
+    """
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric '{metric}', choose one of {', '.join(METRICS)}")
+
+    names = tuple(sorted(known))
+    key = cache.key("quantity", metric, name, module, *names)
+    entry = cache.load(key, module)
+
+    if entry is None:
+        from sympy import Symbol
+        from blackholepy import formulas
+        from blackholepy.graph import metric_graph
+
+        graph = metric_graph(next(m for m in (formulas.SchwarzschildMetric, formulas.ReissnerNordströmMetric, formulas.KerrMetric, formulas.KerrNewmanMetric) if m.name == metric))
+        args, function = graph.compile(Symbol(name), [Symbol(n) for n in names], module)
+        entry = tuple(symbol.name for symbol in args), function
+        cache.store(key, *entry)
+
+    args, function = entry
+    return function(*(known[arg] for arg in args))
@@ -0,0 +1,34 @@
+import numpy as np
+
+from blackholepy.population import BlackHolePopulation
+
+_ALIASES: dict[str, str] = {
+    "r_plus":              "outerHorizon",
+    "r_minus":             "innerHorizon",
+    "hawking_temperature": "temperature"
+}
+"Names of the metrics' formulas (see `BlackHoleMetric`) for the properties of a population"
+
+def sweep(quantity: str, M: np.ndarray, a: np.ndarray = 0, Q: np.ndarray = 0) -> np.ndarray:
+    """Evaluates a property of black holes over a grid of masses `M`, spins `a` and charges `Q`, which are broadcast against each other.<br>
+    `quantity` is the name of a property of `BlackHolePopulation` (e.g. `"temperature"`, `"surface_gravity"`)
+    or of a formula of `BlackHoleMetric` (e.g. `"hawking_temperature"`, `"r_plus"`).
+
+    Points outside of the domain, a negative mass or a spin or charge exceeding the limits of the cosmic censorship hypothesis, are NaN instead of raising.
+    Returns an array of the broadcast shape.
+    """
+    name = _ALIASES.get(quantity, quantity)
+    if name.startswith("_") or not isinstance(getattr(BlackHolePopulation, name, None), property):
+        raise ValueError(f"Unknown quantity '{quantity}'")
+
+    M, a, Q = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in (M, a, Q)))
+    population = BlackHolePopulation._unchecked(M.ravel().copy(), a.ravel().copy(), Q.ravel().copy())
+
+    with np.errstate(invalid="ignore"):
+        valid = (
+            (population.mass >= 0)
+            & (np.abs(population.spin) <= population._max_allowed_spin)
+            & (np.abs(population.charge) <= population._max_allowed_charge)
+        )
+    values = np.where(valid, getattr(population, name), np.nan)
+    return values.reshape(M.shape)
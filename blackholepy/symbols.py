@@ -36,6 +36,15 @@ constants = {
     ε_0:    Rational('8.8541878188e-12')
 }
 
+# Naturkonstanten als Symbole: Formeln werden mit ihnen aufgestellt, damit ihre Dimensionen geprüft werden können (siehe `formulas.dimensional`)
+constant_symbols: dict[Symbol, Rational] = {
+    Symbol("c"):    c,
+    Symbol("G"):    G,
+    Symbol("ℏ"):    ℏ,
+    Symbol("k_B"):  k_B,
+    Symbol("ε_0"):  ε_0
+}
+
 sunmass:        Rational = Rational('1.989e30')             # kilogram
 earthmass:      Rational = Rational('5.969e24')             # kilogram
 moonmass:       Rational = Rational('7.346e11')             # kilogram